@@ -0,0 +1,253 @@
+"""
+Benchmark suite: throughput, dispatch cost, memory and service quality.
+
+Every standard scenario is run once per strategy on a fixed passenger stream,
+so the domain metrics (waits, travel) are exactly reproducible and only the
+timings vary between machines. Results are written as JSON; `compare` checks
+a run against a stored baseline and exits non-zero on regressions.
+
+    python benchmark.py run --out benchmarks/latest.json
+    python benchmark.py run --cache --out benchmarks/cached.json
+    python benchmark.py compare benchmarks/baseline.json benchmarks/latest.json
+    python benchmark.py startup --runs 20
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, NamedTuple, Optional
+
+import registry
+from building import Building
+from main import create_building
+from traffic import Segment, generate_day, run_traffic
+
+
+class Scenario(NamedTuple):
+    floors: int
+    elevators: int
+    segments: List[Segment]
+    capacity: Optional[int] = 16
+    seed: int = 1
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "small":    Scenario(6, 2, [Segment(0, 20000, "interfloor", 0.05)]),
+    "midrise":  Scenario(20, 6, [Segment(0, 1000, "up_peak", 0.4),
+                                 Segment(1000, 2000, "interfloor", 0.2),
+                                 Segment(2000, 3000, "down_peak", 0.4)]),
+    "highrise": Scenario(100, 32, [Segment(0, 1500, "interfloor", 1.5)]),
+    "burst":    Scenario(20, 4, [Segment(0, 60, "up_peak", 8.0),
+                                 Segment(60, 600, "interfloor", 0.05)]),
+}
+
+# metric -> True when higher is better; used by compare()
+TIMINGS = ("ticks_per_s", "dispatch_us", "peak_kib")   # machine-dependent, noisier
+METRICS = {
+    "ticks_per_s": True,
+    "dispatch_us": False,
+    "peak_kib": False,
+    "wait_mean": False,
+    "wait_p95": False,
+    "journey_mean": False,
+    "floors_travelled": False,
+}
+
+
+def _simulate(scenario: Scenario, strategy: str, cache: bool = False) -> tuple:
+    building: Building = create_building(scenario.floors, scenario.elevators, registry.create_strategy(strategy))
+    metrics = building.enable_metrics()
+    if cache:
+        building.enable_dispatch_cache()
+    passengers = generate_day(scenario.floors, scenario.segments, scenario.seed)
+    started = time.perf_counter()
+    summary = run_traffic(building, passengers, capacity=scenario.capacity)
+    return summary, metrics, time.perf_counter() - started, building.dispatch_cache
+
+
+def run_case(name: str, strategy: str, repeat: int = 1, memory: bool = True,
+             cache: bool = False) -> dict:
+    """Benchmark one scenario/strategy pair; timings are the best of `repeat` runs."""
+    scenario = SCENARIOS[name]
+    best = None
+    for _ in range(repeat):
+        summary, metrics, elapsed, decisions = _simulate(scenario, strategy, cache)
+        if best is None or elapsed < best[2]:
+            best = (summary, metrics, elapsed, decisions)
+    summary, metrics, elapsed, decisions = best
+
+    peak = None
+    if memory:
+        # Separate pass: tracemalloc slows everything down too much to time under it.
+        tracemalloc.start()
+        _simulate(scenario, strategy, cache)
+        peak = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+
+    stats = metrics.to_dict()
+    row = {
+        "scenario": name,
+        "strategy": strategy,
+        "ticks": summary["ticks"],
+        "passengers": summary["passengers"],
+        "delivered": summary["delivered"],
+        "ticks_per_s": round(summary["ticks"] / elapsed, 1),
+        "dispatch_us": round(metrics.phase_seconds["dispatch"] / max(metrics.hall_calls, 1) * 1e6, 3),
+        "peak_kib": peak,
+        "wait_mean": stats["wait_ticks"]["mean"],
+        "wait_p95": stats["wait_ticks"]["p95"],
+        "journey_mean": stats["journey_ticks"]["mean"],
+        "floors_travelled": stats["floors_travelled"],
+    }
+    if decisions is not None:
+        row["cache_hit_rate"] = round(decisions.hit_rate(), 3)
+    return row
+
+
+def run_suite(scenarios: List[str], strategies: List[str], repeat: int = 1,
+              memory: bool = True, cache: bool = False) -> dict:
+    results = {}
+    _simulate(SCENARIOS["small"], strategies[0], cache)    # warm-up: imports, allocator, caches
+    suffix = "+cache" if cache else ""
+    for name in scenarios:
+        for strategy in strategies:
+            results[f"{name}/{strategy}{suffix}"] = run_case(name, strategy, repeat, memory, cache)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+            "dispatch_cache": cache,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 5.0,
+            timing_threshold: float = 20.0) -> List[str]:
+    """
+    Return one line per metric that got worse by more than the allowed percent:
+    `timing_threshold` for timings and memory, `threshold` for the
+    (deterministic) service-quality metrics.
+    """
+    regressions = []
+    for key, now in current["results"].items():
+        before = baseline["results"].get(key)
+        if before is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = before.get(metric), now.get(metric)
+            if old is None or new is None or old == new:
+                continue
+            change = (new - old) / old * 100 if old else float("inf")
+            worse = -change if higher_is_better else change
+            if worse > (timing_threshold if metric in TIMINGS else threshold):
+                regressions.append(f"{key:<22} {metric:<17} {old:>12} -> {new:<12} ({change:+.1f}%)")
+    return regressions
+
+
+# Cold start per run mode: a fresh interpreter does the smallest useful job.
+STARTUP_MODES = {
+    "bare":   "pass",
+    "batch":  "import main; main.run_batch(main.create_building(), 'scenarios/morning.txt')",
+    "script": ("import io, sys, main; sys.stdin = io.StringIO('fr 3 up\\ntick 5\\nstatus\\n'); "
+               "main.run_script(main.create_building(), '-', 'summary')"),
+    "serve":  "import main, server",
+    "gui":    "import main, registry; registry.view_class('gui')",
+}
+
+
+def measure_startup(runs: int = 10) -> dict:
+    """Median / min wall time (ms) of each mode in a new process, and whether it loaded tkinter."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+    for mode, code in STARTUP_MODES.items():
+        probe = code + "; import sys; sys.stderr.write(str('tkinter' in sys.modules))"
+        times = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            done = subprocess.run([sys.executable, "-c", probe], cwd=here, check=True,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            times.append((time.perf_counter() - started) * 1000)
+        results[mode] = {
+            "median_ms": round(statistics.median(times), 1),
+            "min_ms": round(min(times), 1),
+            "tkinter": done.stderr.strip().endswith("True"),
+        }
+    return results
+
+
+def format_results(report: dict) -> str:
+    rows = list(report["results"].values())
+    columns = ("scenario", "strategy", "ticks", "delivered", *METRICS)
+    if report["meta"].get("dispatch_cache"):
+        columns += ("cache_hit_rate",)
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in columns}
+    lines = ["  ".join(c.rjust(widths[c]) for c in columns)]
+    for row in rows:
+        lines.append("  ".join(str(row[c]).rjust(widths[c]) for c in columns))
+    return "\n".join(lines)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark throughput and dispatch quality.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the suite and store the results as JSON")
+    run.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    run.add_argument("--strategies", nargs="+", default=registry.strategy_names(),
+                     choices=registry.strategy_names())
+    run.add_argument("--repeat", type=int, default=3, help="timing runs per case (best is kept)")
+    run.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    run.add_argument("--cache", action="store_true", help="enable the dispatch decision cache")
+    run.add_argument("--out", default=os.path.join("benchmarks", "latest.json"))
+
+    cmp = sub.add_parser("compare", help="flag regressions against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=5.0,
+                     help="allowed worsening of wait / travel metrics, in percent")
+    cmp.add_argument("--timing-threshold", type=float, default=20.0,
+                     help="allowed worsening of throughput, dispatch time and memory, in percent")
+
+    start = sub.add_parser("startup", help="cold-start time of each run mode")
+    start.add_argument("--runs", type=int, default=10)
+    start.add_argument("--out", help="also write the numbers as JSON")
+
+    args = parser.parse_args(argv)
+    if args.command == "startup":
+        results = measure_startup(args.runs)
+        print(f"{'mode':<8} {'median_ms':>10} {'min_ms':>8}  tkinter")
+        for mode, row in results.items():
+            print(f"{mode:<8} {row['median_ms']:>10} {row['min_ms']:>8}  {row['tkinter']}")
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as fh:
+                json.dump(results, fh, indent=2)
+    elif args.command == "run":
+        report = run_suite(args.scenarios, args.strategies, args.repeat, not args.no_memory, args.cache)
+        print(format_results(report))
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"results written to {args.out}")
+    else:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        with open(args.current, encoding="utf-8") as fh:
+            current = json.load(fh)
+        regressions = compare(baseline, current, args.threshold, args.timing_threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s):")
+            print("\n".join(regressions))
+            sys.exit(1)
+        print("no regressions")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,9 +1,15 @@
+from array import array
 from collections import deque
-from typing import List, Deque, Callable
+from typing import TYPE_CHECKING, List, Deque, Callable, Optional, Iterable, Union
 
 from elevator import Elevator
-from requests import FloorRequest, CabinRequest
-from strategy import DispatchStrategy
+from requests import FloorRequest, CabinRequest, PackedFloorQueue, requests_from_codes, unpack_floor_request
+from strategy import CachedDispatchStrategy, DispatchStrategy
+from observer_bus import ObserverBus, Delivery, Subscription
+from metrics import Metrics, PhaseClock
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 class Building:
@@ -14,57 +20,304 @@ class Building:
         total_floors: int,
         elevators: List[Elevator],
         dispatch_strategy: DispatchStrategy,
+        array_engine: bool = False,
+        packed_queue: bool = False,
     ):
         self.total_floors = total_floors
+        self._fleet = None
+        if array_engine:
+            # Opt-in NumPy engine; the elevators become views onto its arrays.
+            from fleet import FleetEngine
+            self._fleet = FleetEngine(elevators)
+            elevators = self._fleet.cars
         self.elevators = elevators
-        self.dispatch_strategy = dispatch_strategy
-        self.hallway_queue: Deque[FloorRequest] = deque()
-        self._observers: List[Callable[["Building"], None]] = []
+        self._by_id = {e.identifier: e for e in elevators}
+        self.dispatch_cache: Optional[CachedDispatchStrategy] = None  # see enable_dispatch_cache()
+        self.dispatch_strategy = self._fit_strategy(dispatch_strategy)
+        # Opt-in packed ring buffer: 8 bytes per pending call instead of an object.
+        self.hallway_queue: Union[Deque[FloorRequest], PackedFloorQueue] = (
+            PackedFloorQueue() if packed_queue else deque())
+        self.clock = 0  # number of ticks simulated so far
+        self._observers = ObserverBus()
+        self.metrics: Optional[Metrics] = None  # see enable_metrics()
+        self.journal = None  # optional persistence.EventLog recording every input
+        self.history = None  # optional history.FleetHistory, see enable_history()
 
     # ------------------------------------------------------------------
     # Observer helpers
     # ------------------------------------------------------------------
-    def add_observer(self, callback: Callable[["Building"], None]) -> None:
-        self._observers.append(callback)
+    def add_observer(
+        self,
+        callback: Callable,
+        delivery: Delivery = Delivery.SYNC,
+        max_rate: Optional[float] = None,
+        loop: Optional["asyncio.AbstractEventLoop"] = None,
+    ) -> Subscription:
+        """
+        Register a callback. SYNC callbacks receive the Building inside step();
+        THREAD / ASYNCIO callbacks receive the latest BuildingSnapshot off the
+        simulation loop, at most `max_rate` times per second.
+        """
+        return self._observers.subscribe(callback, delivery, max_rate, loop)
+
+    def remove_observer(self, subscription: Subscription) -> None:
+        self._observers.unsubscribe(subscription)
+
+    def close_observers(self) -> None:
+        """Deliver the final state to queued observers and stop their consumers."""
+        self._observers.flush(self)
+        self._observers.close()
 
     def _notify_observers(self) -> None:
-        for cb in self._observers:
-            cb(self)
+        self._observers.publish(self)
 
     # ------------------------------------------------------------------
     # Public API – called by the controller
     # ------------------------------------------------------------------
     def add_floor_request(self, request: FloorRequest) -> None:
         """Add a hallway call (floor + direction) to the queue."""
+        if request.created_at is None:
+            request.created_at = self.clock
+        if self.journal is not None:
+            self.journal.record_floor_request(request)
         self.hallway_queue.append(request)
 
     def add_cabin_request(self, request: CabinRequest) -> None:
         """Route a cabin button press to the appropriate elevator."""
-        for elevator in self.elevators:
-            if elevator.identifier == request.elevator_identifier:
-                elevator.add_target_floor(request.floor)
-                return
-        print(f"[warning] Elevator with id {request.elevator_identifier} not found")
+        if request.created_at is None:
+            request.created_at = self.clock
+        if self.journal is not None:
+            self.journal.record_cabin_request(request)
+        elevator = self._by_id.get(request.elevator_identifier)
+        if elevator is None:
+            self._unknown_elevator(request.elevator_identifier)
+            return
+        elevator.add_target_floor(request.floor)
+        if self.metrics is not None:
+            self.metrics.on_cabin_request(elevator, request, self.clock)
+
+    # ------------------------------------------------------------------
+    # Bulk intake – replaying recorded traffic
+    # ------------------------------------------------------------------
+    def add_floor_requests(self, requests: Union[Iterable[FloorRequest], array]) -> int:
+        """
+        Queue many hallway calls at once; returns how many were queued.
+
+        Accepts FloorRequest objects or a packed int array in which each
+        entry is (floor << 1) | direction_up.
+        """
+        clock = self.clock
+        if isinstance(requests, array):
+            if self.journal is None and isinstance(self.hallway_queue, PackedFloorQueue):
+                self.hallway_queue.extend_codes(requests, clock)   # no objects at all
+                return len(requests)
+            batch = [FloorRequest(code >> 1, bool(code & 1), clock) for code in requests]
+        else:
+            batch = list(requests)
+            for request in batch:
+                if request.created_at is None:
+                    request.created_at = clock
+        if self.journal is not None:
+            for request in batch:
+                self.journal.record_floor_request(request)
+        self.hallway_queue.extend(batch)
+        return len(batch)
+
+    def add_cabin_requests(self, requests: Union[Iterable[CabinRequest], array]) -> int:
+        """
+        Apply many cabin button presses at once; returns how many were applied.
+
+        Accepts CabinRequest objects or a packed int array of flat
+        (elevator_identifier, floor) pairs. Unknown elevators are skipped with
+        the same warning add_cabin_request prints.
+        """
+        by_id, metrics, clock = self._by_id, self.metrics, self.clock
+        applied = 0
+        if isinstance(requests, array):
+            pairs = zip(requests[0::2], requests[1::2])
+            if metrics is None and self.journal is None:
+                # Fast path: nothing needs the request objects.
+                for ident, floor in pairs:
+                    elevator = by_id.get(ident)
+                    if elevator is None:
+                        self._unknown_elevator(ident)
+                        continue
+                    elevator.add_target_floor(floor)
+                    applied += 1
+                return applied
+            requests = [CabinRequest(ident, floor, clock) for ident, floor in pairs]
+        for request in requests:
+            if request.created_at is None:
+                request.created_at = clock
+            if self.journal is not None:
+                self.journal.record_cabin_request(request)
+            elevator = by_id.get(request.elevator_identifier)
+            if elevator is None:
+                self._unknown_elevator(request.elevator_identifier)
+                continue
+            elevator.add_target_floor(request.floor)
+            if metrics is not None:
+                metrics.on_cabin_request(elevator, request, clock)
+            applied += 1
+        return applied
+
+    @staticmethod
+    def _unknown_elevator(identifier: int) -> None:
+        print(f"[warning] Elevator with id {identifier} not found")
+
+    def _dropped_call(self, request: FloorRequest) -> None:
+        print(f"[warning] no elevator serves floor {request.floor} "
+              f"going {'up' if request.direction_up else 'down'} – call dropped")
+        if self.metrics is not None:
+            self.metrics.on_dropped_call(request)
 
     def set_dispatch_strategy(self, strategy: DispatchStrategy) -> None:
-        self.dispatch_strategy = strategy
+        if self.journal is not None:
+            self.journal.record_strategy(strategy)
+        self.dispatch_strategy = self._fit_strategy(strategy)
+
+    def _fit_strategy(self, strategy: DispatchStrategy) -> DispatchStrategy:
+        """
+        Put the decision cache (if enabled) around the strategy and, in a zoned
+        fleet, wrap that so it only sees cars that can serve each call.
+        """
+        from zoning import ZonedDispatchStrategy, is_zoned
+        cache = self.dispatch_cache
+        if cache is not None and strategy is not cache:
+            if isinstance(strategy, ZonedDispatchStrategy):
+                strategy = strategy.inner                  # re-wrapped below, outside the cache
+            cache.reset(strategy)                          # decisions of the old strategy are stale
+            strategy = cache
+        if is_zoned(self.elevators) and not isinstance(strategy, ZonedDispatchStrategy):
+            return ZonedDispatchStrategy(strategy)
+        return strategy
+
+    def enable_dispatch_cache(self, maxsize: int = 4096) -> CachedDispatchStrategy:
+        """Memoise dispatch decisions (see CachedDispatchStrategy) and return the cache."""
+        if self.dispatch_cache is None:
+            self.dispatch_cache = CachedDispatchStrategy(self.dispatch_strategy, maxsize)
+            self.dispatch_strategy = self._fit_strategy(self.dispatch_strategy)
+        self.dispatch_cache.maxsize = maxsize
+        return self.dispatch_cache
+
+    def disable_dispatch_cache(self) -> None:
+        if self.dispatch_cache is not None:
+            strategy = self.dispatch_cache.inner
+            self.dispatch_cache = None
+            self.dispatch_strategy = self._fit_strategy(strategy)
+
+    def enable_metrics(self) -> Metrics:
+        """Start collecting instrumentation (fresh counters) and return the collector."""
+        self.metrics = Metrics()
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        self.metrics = None
+
+    def enable_history(self, capacity: int = 100_000, spill: Optional[str] = None):
+        """Record every tick's car floors, states and queue lengths (see history.FleetHistory)."""
+        from history import FleetHistory
+        self.disable_history()
+        self.history = FleetHistory(self, capacity, spill)
+        return self.history
+
+    def disable_history(self) -> None:
+        if self.history is not None:
+            self.history.close()
+            self.history = None
+
+    def is_idle(self) -> bool:
+        """Return True when no hallway call is pending and every elevator is idle."""
+        return not self.hallway_queue and all(e.is_idle() for e in self.elevators)
 
     # ------------------------------------------------------------------
     # Simulation tick
     # ------------------------------------------------------------------
-    def step(self) -> None:
+    def step(self, notify: bool = True) -> None:
         """Process hallway queue, move all elevators and notify observers."""
+        if self.journal is not None:
+            self.journal.record_step()
+        metrics = self.metrics
+        if metrics is not None:
+            phases = PhaseClock(metrics)
+
         # 1) Assign every queued hallway request to an elevator via the strategy.
-        while self.hallway_queue:
-            call = self.hallway_queue.popleft()
-            chosen_elevator = self.dispatch_strategy.select_elevator(
-                self.elevators, call
-            )
-            chosen_elevator.add_target_floor(call.floor)
+        queue = self.hallway_queue
+        if queue:
+            if isinstance(queue, PackedFloorQueue):
+                # Straight from the codes: one reused request object for the whole batch.
+                codes = queue.drain_codes()
+                chosen = self.dispatch_strategy.select_elevators(self.elevators, requests_from_codes(codes))
+                calls = map(unpack_floor_request, codes)
+            else:
+                calls = list(queue)
+                queue.clear()
+                chosen = self.dispatch_strategy.select_elevators(self.elevators, calls)
+            if metrics is not None or None in chosen:     # None: no car can take the call
+                for call, elevator in zip(calls, chosen):
+                    if elevator is None:
+                        self._dropped_call(call)
+                    elif metrics is not None:
+                        metrics.on_dispatch(elevator, call, self.clock)
 
         # 2) Advance each elevator by one tick.
-        for elevator in self.elevators:
-            elevator.step()
+        if metrics is not None:
+            phases.lap("dispatch")
+            metrics.before_move(self.elevators)
+        if self._fleet is not None:
+            self._fleet.step()
+        else:
+            for elevator in self.elevators:
+                elevator.step()
+
+        self.clock += 1
+        if self.history is not None:
+            self.history.record(self)
+        if metrics is not None:
+            metrics.after_move(self.elevators, self.clock)
+            phases.lap("elevators")
 
         # 3) Notify any observers (e.g. CLI view).
+        if notify:
+            self._notify_observers()
+            if metrics is not None:
+                phases.lap("notify")
+
+    def advance(self, ticks: int) -> None:
+        """Run several ticks back to back and notify observers once at the end."""
+        for _ in range(ticks):
+            self.step(notify=False)
+        if ticks > 0:
+            self._notify_observers()
+
+    def run_until_idle(self, max_ticks: Optional[int] = None) -> int:
+        """Step until the building is idle (or `max_ticks` ran); notify once. Returns ticks run."""
+        ticks = 0
+        while not self.is_idle() and (max_ticks is None or ticks < max_ticks):
+            self.step(notify=False)
+            ticks += 1
         self._notify_observers()
+        return ticks
+
+    def skip_ticks(self, ticks: int) -> None:
+        """
+        Fast-forward `ticks` ticks in which nothing but travel happens.
+
+        The caller guarantees the hallway queue is empty and no elevator changes
+        state during the skipped span (see Elevator.ticks_until_transition).
+        Observers are not notified.
+        """
+        if ticks <= 0:
+            return
+        if self.journal is not None:
+            self.journal.record_skip(ticks)
+        if self.metrics is not None:
+            self.metrics.on_skip(self.elevators, ticks)
+        if self._fleet is not None:
+            self._fleet.coast(ticks)
+        else:
+            for elevator in self.elevators:
+                elevator.coast(ticks)
+        self.clock += ticks
+        if self.history is not None:
+            self.history.record(self)
@@ -0,0 +1,361 @@
+"""
+A campus of many buildings stepped in parallel worker processes.
+
+Buildings are sharded across workers; each worker owns its Buildings (and a
+TrafficFeeder per building) outright. After every advance the workers write
+each building's clock, counters and per-car (floor, state, stops) into one
+shared-memory block of int32s, so the coordinator reads a consistent global
+snapshot without pickling any Building. Commands and the routed slice of the
+shared traffic feed travel over one pipe per worker; the replies double as
+the tick barrier.
+
+    with Campus([BuildingSpec(30, 6)] * 24, workers=4) as campus:
+        CampusView(campus)
+        campus.load_traffic(campus_traffic(24, 30, duration=3600, rate=0.2))
+        campus.advance(3600, sync_every=60)
+"""
+import multiprocessing as mp
+import os
+import random
+import time
+from collections import defaultdict
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from elevator import ElevatorState, ServiceOrder
+from requests import CabinRequest, FloorRequest
+from traffic import Passenger, generate_traffic
+
+# int32 slots per building header and per car in the shared block
+HEADER_FIELDS = ("clock", "hall_calls", "arrived", "delivered")
+CAR_FIELDS = ("floor", "state", "stops")
+_INT = 4
+
+
+class BuildingSpec(NamedTuple):
+    floors: int
+    elevators: int
+    strategy: str = "nearest"
+    service_order: ServiceOrder = ServiceOrder.FIFO
+    capacity: Optional[int] = None
+
+
+class CarState(NamedTuple):
+    floor: int
+    state: ElevatorState
+    stops: int
+
+
+class BuildingState(NamedTuple):
+    clock: int
+    hall_calls: int
+    arrived: int
+    delivered: int
+    cars: Tuple[CarState, ...]
+
+
+class CampusSnapshot(NamedTuple):
+    clock: int
+    buildings: Tuple[BuildingState, ...]
+
+
+def _layout(specs: List[BuildingSpec]) -> List[int]:
+    """Offset (in ints) of each building's record in the shared block."""
+    offsets, pos = [], 0
+    for spec in specs:
+        offsets.append(pos)
+        pos += len(HEADER_FIELDS) + len(CAR_FIELDS) * spec.elevators
+    offsets.append(pos)
+    return offsets
+
+
+# ----------------------------------------------------------------------
+# Worker process
+# ----------------------------------------------------------------------
+def _publish(shared, offset: int, building, feeder) -> None:
+    """Write one building's header and car records into the shared block."""
+    shared[offset] = building.clock
+    shared[offset + 1] = len(building.hallway_queue)
+    shared[offset + 2] = feeder.arrived
+    shared[offset + 3] = feeder.delivered
+    pos = offset + len(HEADER_FIELDS)
+    for elevator in building.elevators:
+        shared[pos] = elevator.current_floor
+        shared[pos + 1] = elevator.state.value
+        shared[pos + 2] = len(elevator.target_floors)
+        pos += len(CAR_FIELDS)
+
+
+def _worker(conn, shm_name: str, shard: Dict[int, BuildingSpec], offsets: List[int]) -> None:
+    import registry
+    from main import create_building
+    from traffic import TrafficFeeder
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    shared = shm.buf.cast("i")
+    sites = {}
+    for index, spec in shard.items():
+        building = create_building(spec.floors, spec.elevators, registry.create_strategy(spec.strategy),
+                                   service_order=spec.service_order)
+        sites[index] = (building, TrafficFeeder(building, (), spec.capacity))
+        _publish(shared, offsets[index], *sites[index])
+    conn.send(True)
+    try:
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            ticks, passengers, calls = message
+            for index, (building, feeder) in sites.items():
+                if index in passengers:
+                    feeder.extend(Passenger(*p) for p in passengers[index])
+                for kind, a, b in calls.get(index, ()):
+                    if kind == "fr":
+                        building.add_floor_request(FloorRequest(a, b))
+                    else:
+                        building.add_cabin_request(CabinRequest(a, b))
+                pump, step = feeder.pump, building.step
+                for _ in range(ticks):
+                    pump()
+                    step(notify=False)
+                _publish(shared, offsets[index], building, feeder)
+            conn.send(True)
+    finally:
+        shared.release()
+        shm.close()
+
+
+# ----------------------------------------------------------------------
+# Coordinator
+# ----------------------------------------------------------------------
+class Campus:
+    """Owns the worker processes and the shared state block; see module docstring."""
+
+    def __init__(self, specs: Iterable[BuildingSpec], workers: Optional[int] = None):
+        self.specs = list(specs)
+        self.clock = 0
+        workers = max(1, min(workers or os.cpu_count() or 1, len(self.specs)))
+        self._offsets = _layout(self.specs)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(self._offsets[-1], 1) * _INT)
+        self._shared = self._shm.buf.cast("i")
+        self._observers: List[Callable[["Campus"], None]] = []
+        self._traffic: Optional[Iterator[Tuple[int, Passenger]]] = None
+        self._lookahead: Optional[Tuple[int, Passenger]] = None
+        self._calls: Dict[int, list] = defaultdict(list)
+
+        # Round-robin sharding keeps big and small buildings spread evenly.
+        self._owner: List[int] = [i % workers for i in range(len(self.specs))]
+        ctx = mp.get_context()
+        self._pipes, self._procs = [], []
+        for w in range(workers):
+            parent, child = ctx.Pipe()
+            shard = {i: spec for i, spec in enumerate(self.specs) if self._owner[i] == w}
+            proc = ctx.Process(target=_worker, args=(child, self._shm.name, shard, self._offsets),
+                               daemon=True)
+            proc.start()
+            child.close()
+            self._pipes.append(parent)
+            self._procs.append(proc)
+        for pipe in self._pipes:
+            pipe.recv()
+
+    # ------------------------------------------------------------------
+    # Inputs
+    # ------------------------------------------------------------------
+    def add_floor_request(self, building: int, request: FloorRequest) -> None:
+        """Queue a hall call for `building`; it is delivered with the next advance."""
+        self._calls[building].append(("fr", request.floor, request.direction_up))
+
+    def add_cabin_request(self, building: int, request: CabinRequest) -> None:
+        self._calls[building].append(("cr", request.elevator_identifier, request.floor))
+
+    def load_traffic(self, stream: Iterable[Tuple[int, Passenger]]) -> None:
+        """
+        Attach the campus-wide passenger feed: (building index, Passenger) in
+        tick order. It is read lazily; each advance ships every worker just
+        the passengers arriving in its window.
+        """
+        self._traffic = iter(stream)
+        self._lookahead = next(self._traffic, None)
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+    def step(self) -> None:
+        self.advance(1)
+
+    def advance(self, ticks: int, sync_every: Optional[int] = None) -> None:
+        """
+        Run `ticks` ticks in every building. Workers synchronise (and observers
+        are notified) every `sync_every` ticks – by default once at the end.
+        """
+        chunk = sync_every or ticks
+        done = 0
+        while done < ticks:
+            n = min(chunk, ticks - done)
+            self._round(n)
+            done += n
+            self._notify_observers()
+
+    def _round(self, ticks: int) -> None:
+        end = self.clock + ticks
+        passengers: List[Dict[int, list]] = [defaultdict(list) for _ in self._pipes]
+        while self._lookahead is not None and self._lookahead[1].tick < end:
+            index, p = self._lookahead
+            passengers[self._owner[index]][index].append(tuple(p))
+            self._lookahead = next(self._traffic, None)
+        calls: List[Dict[int, list]] = [{} for _ in self._pipes]
+        for index, batch in self._calls.items():
+            calls[self._owner[index]][index] = batch
+        self._calls = defaultdict(list)
+
+        for w, pipe in enumerate(self._pipes):
+            pipe.send((ticks, dict(passengers[w]), calls[w]))
+        for pipe in self._pipes:                      # barrier: every shard has finished
+            pipe.recv()
+        self.clock = end
+
+    # ------------------------------------------------------------------
+    # Shared state
+    # ------------------------------------------------------------------
+    def snapshot(self) -> CampusSnapshot:
+        """Consistent copy of every building's state (workers are idle between rounds)."""
+        shared, buildings = self._shared, []
+        header, width = len(HEADER_FIELDS), len(CAR_FIELDS)
+        for index, spec in enumerate(self.specs):
+            pos = self._offsets[index]
+            raw = shared[pos:self._offsets[index + 1]].tolist()
+            cars = tuple(
+                CarState(raw[i], ElevatorState(raw[i + 1]), raw[i + 2])
+                for i in range(header, header + width * spec.elevators, width)
+            )
+            buildings.append(BuildingState(*raw[:header], cars))
+        return CampusSnapshot(self.clock, tuple(buildings))
+
+    def traffic_done(self) -> bool:
+        """True once the feed is drained and every passenger has been delivered."""
+        if self._lookahead is not None:
+            return False
+        return all(b.arrived == b.delivered for b in self.snapshot().buildings)
+
+    # ------------------------------------------------------------------
+    # Observers
+    # ------------------------------------------------------------------
+    def add_observer(self, callback: Callable[["Campus"], None]) -> None:
+        """Called with the campus after every synchronised round."""
+        self._observers.append(callback)
+
+    def remove_observer(self, callback: Callable[["Campus"], None]) -> None:
+        if callback in self._observers:
+            self._observers.remove(callback)
+
+    def _notify_observers(self) -> None:
+        for callback in self._observers:
+            callback(self)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        for pipe in self._pipes:
+            try:
+                pipe.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join()
+        for pipe in self._pipes:
+            pipe.close()
+        self._shared.release()
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> "Campus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class CampusView:
+    """Aggregate console view: one line for the whole campus per synchronised round."""
+
+    def __init__(self, campus: Campus, per_building: bool = False, out: Optional[TextIO] = None):
+        self._per_building = per_building
+        self._out = out
+        campus.add_observer(self.render)
+
+    def render(self, campus: Campus) -> None:
+        snap = campus.snapshot()
+        cars = [car for b in snap.buildings for car in b.cars]
+        busy = sum(1 for car in cars if car.state != ElevatorState.IDLE)
+        lines = [
+            f"tick {snap.clock} | buildings {len(snap.buildings)} | busy {busy}/{len(cars)} | "
+            f"stops {sum(car.stops for car in cars)} | "
+            f"hall calls {sum(b.hall_calls for b in snap.buildings)} | "
+            f"delivered {sum(b.delivered for b in snap.buildings)}/"
+            f"{sum(b.arrived for b in snap.buildings)}"
+        ]
+        if self._per_building:
+            for index, b in enumerate(snap.buildings):
+                floors = " ".join(str(car.floor) for car in b.cars)
+                lines.append(f"  B{index:<3} floors [{floors}] hall {b.hall_calls} "
+                             f"delivered {b.delivered}/{b.arrived}")
+        print("\n".join(lines), file=self._out)
+
+
+def campus_traffic(buildings: int, floors: int, duration: int, rate: float,
+                   pattern: str = "interfloor", seed: int = 0) -> Iterator[Tuple[int, Passenger]]:
+    """One campus-wide Poisson feed of `rate` passengers/tick, spread over the buildings at random."""
+    rng = random.Random(f"campus-{seed}")
+    for p in generate_traffic(floors, duration, rate, pattern, seed):
+        yield rng.randrange(buildings), p
+
+
+def run_campus(campus: Campus, sync_every: int = 100, max_ticks: Optional[int] = None) -> dict:
+    """Advance until the loaded traffic is fully delivered (or `max_ticks`)."""
+    started = time.perf_counter()
+    while not campus.traffic_done():
+        if max_ticks is not None and campus.clock >= max_ticks:
+            break
+        campus.advance(sync_every)
+    elapsed = time.perf_counter() - started
+    snap = campus.snapshot()
+    building_ticks = campus.clock * len(snap.buildings)
+    return {
+        "ticks": campus.clock,
+        "buildings": len(snap.buildings),
+        "passengers": sum(b.arrived for b in snap.buildings),
+        "delivered": sum(b.delivered for b in snap.buildings),
+        "elapsed_s": elapsed,
+        "building_ticks_per_s": building_ticks / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    from scenario import format_summary
+
+    parser = argparse.ArgumentParser(description="Simulate a campus of buildings in parallel.")
+    parser.add_argument("--buildings", type=int, default=16)
+    parser.add_argument("--floors", type=int, default=20)
+    parser.add_argument("--elevators", type=int, default=4)
+    parser.add_argument("--strategy", default="nearest")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--rate", type=float, default=1.0, help="campus-wide passengers per tick")
+    parser.add_argument("--duration", type=int, default=3600)
+    parser.add_argument("--sync-every", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--view", action="store_true", help="print the aggregate view every sync")
+    args = parser.parse_args()
+
+    spec = BuildingSpec(args.floors, args.elevators, args.strategy)
+    with Campus([spec] * args.buildings, args.workers) as campus:
+        if args.view:
+            CampusView(campus)
+        campus.load_traffic(campus_traffic(args.buildings, args.floors, args.duration, args.rate,
+                                           seed=args.seed))
+        print(format_summary(run_campus(campus, args.sync_every)))
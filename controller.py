@@ -1,6 +1,16 @@
+import struct
+from array import array
+from typing import Iterable, Optional, TextIO
+
 from building import Building
 from requests import FloorRequest, CabinRequest
-from strategy import NearestElevatorStrategy, LeastBusyElevatorStrategy
+import registry
+
+# Compact binary call record: kind, arg1, arg2 (little endian, 5 bytes).
+#   kind 0 / 1 – hallway call down / up at floor arg1 (arg2 unused)
+#   kind 2     – cabin call in elevator arg1 to floor arg2
+CALL_RECORD = struct.Struct("<BHH")
+HALL_DOWN, HALL_UP, CABIN = 0, 1, 2
 
 class Controller:
     """Simple CLI controller that translates user commands into model actions."""
@@ -9,14 +19,18 @@ class Controller:
         "commands:\n"
         "  fr FLOOR up|down         hallway call\n"
         "  cr ELEV_ID FLOOR         cabin button press\n"
-        "  strategy nearest|leastbusy  switch dispatch algorithm\n"
-        "  tick                      advance simulation by one step\n"
+        f"  strategy {'|'.join(registry.strategy_names())}  switch dispatch algorithm\n"
+        "  tick [N]                  advance simulation by one (or N) steps\n"
+        "  run-until-idle [MAX]      step until every call is served\n"
         "  status                    dump current state\n"
+        "  stats [on|off|json PATH|csv PATH]  instrumentation summary / control / export\n"
         "  help                      show this help\n"
     )
 
-    def __init__(self, building: Building):
+    def __init__(self, building: Building, out: Optional[TextIO] = None, file_exports: bool = True):
         self.building = building
+        self.out = out  # None → sys.stdout
+        self.file_exports = file_exports  # False for remote clients: no writing files on this host
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -33,44 +47,187 @@ class Controller:
             floor = self._to_int(parts[1])
             direction = parts[2].lower()
             if floor is not None and direction in {"up", "down"}:
-                self.building.add_floor_request(FloorRequest(floor, direction == "up"))
+                if 0 <= floor < self.building.total_floors:
+                    self.building.add_floor_request(FloorRequest(floor, direction == "up"))
+                else:
+                    self._warn_outside(floor)
             else:
-                print(self.HELP_TEXT)
+                self._print(self.HELP_TEXT)
 
         # ------------------------------------------------ cabin calls
         elif cmd == "cr" and len(parts) == 3:
             elev_id = self._to_int(parts[1])
             floor = self._to_int(parts[2])
             if elev_id is not None and floor is not None:
-                self.building.add_cabin_request(CabinRequest(elev_id, floor))
+                if self._known_elevator(elev_id):
+                    self.building.add_cabin_request(CabinRequest(elev_id, floor))
             else:
-                print(self.HELP_TEXT)
+                self._print(self.HELP_TEXT)
 
         # ------------------------------------------------ strategy switch
         elif cmd == "strategy" and len(parts) == 2:
             name = parts[1].lower()
-            if name == "nearest":
-                self.building.set_dispatch_strategy(NearestElevatorStrategy())
-            elif name == "leastbusy":
-                self.building.set_dispatch_strategy(LeastBusyElevatorStrategy())
+            if name in registry.strategy_names():
+                self.building.set_dispatch_strategy(registry.create_strategy(name))
             else:
-                print("available strategies: nearest | leastbusy")
+                self._print(f"available strategies: {' | '.join(registry.strategy_names())}")
 
         # ------------------------------------------------ tick / status
         elif cmd == "tick":
-            self.building.step()
+            ticks = self._to_int(parts[1]) if len(parts) == 2 else 1
+            if ticks is None or ticks < 1 or len(parts) > 2:
+                self._print(self.HELP_TEXT)
+            elif ticks == 1:
+                self.building.step()
+            else:
+                self.building.advance(ticks)   # one notification for the whole run
+        elif cmd == "run-until-idle":
+            limit = self._to_int(parts[1]) if len(parts) == 2 else None
+            if len(parts) == 2 and limit is None:
+                self._print(self.HELP_TEXT)
+            else:
+                self.building.run_until_idle(limit)
         elif cmd == "status":
             self.building._notify_observers() # run a tick so the view prints fresh data
 
+        # ------------------------------------------------ instrumentation
+        elif cmd == "stats":
+            self._stats(parts[1:])
+
         # ------------------------------------------------ help / unknown
         elif cmd in {"help", "h", "?"}:
-            print(self.HELP_TEXT)
+            self._print(self.HELP_TEXT)
         else:
-            print(self.HELP_TEXT)
+            self._print(self.HELP_TEXT)
+
+    # ------------------------------------------------------------------
+    # Bulk entry points – replaying recorded traffic
+    # ------------------------------------------------------------------
+    def process_batch(self, lines: Iterable[str]) -> int:
+        """
+        Process many command lines; returns the number of lines handled.
+
+        Runs of fr/cr calls are parsed on a fast path and handed to the
+        building's bulk intake; any other command first flushes the pending
+        calls, so the order of effects is the same as line-by-line input.
+        """
+        hall, cabin = array("i"), array("i")
+        floors = self.building.total_floors
+        count = 0
+        for raw in lines:
+            count += 1
+            parts = raw.split()
+            if len(parts) == 3:
+                cmd = parts[0]
+                try:
+                    if cmd == "fr" and parts[2] in ("up", "down"):
+                        floor = int(parts[1])
+                        if 0 <= floor < floors:          # otherwise warned about below
+                            hall.append((floor << 1) | (parts[2] == "up"))
+                            continue
+                    if cmd == "cr":
+                        elev_id, floor = int(parts[1]), int(parts[2])
+                        if self._known_elevator(elev_id):
+                            cabin.extend((elev_id, floor))
+                        continue
+                except ValueError:
+                    pass
+            self._flush_calls(hall, cabin)
+            self.process_user_input(raw)
+        self._flush_calls(hall, cabin)
+        return count
+
+    def process_packed(self, data: bytes) -> int:
+        """
+        Ingest CALL_RECORD-encoded calls; returns the number of records.
+
+        An unknown record kind raises ValueError before any call is applied;
+        hallway calls outside the building and cabin calls for unknown
+        elevators are warned about and skipped, as with line input.
+        """
+        if len(data) % CALL_RECORD.size:
+            raise ValueError("truncated call record")
+        hall, cabin = array("i"), array("i")
+        floors = self.building.total_floors
+        outside, unknown = [], []
+        for index, (kind, arg1, arg2) in enumerate(CALL_RECORD.iter_unpack(data)):
+            if kind == CABIN:
+                if arg1 in self.building._by_id:
+                    cabin.extend((arg1, arg2))
+                else:
+                    unknown.append(arg1)
+            elif kind not in (HALL_DOWN, HALL_UP):
+                raise ValueError(f"unknown call record kind {kind} at record {index}")
+            elif arg1 < floors:
+                hall.append((arg1 << 1) | (kind == HALL_UP))
+            else:
+                outside.append(arg1)
+        for floor in outside:
+            self._warn_outside(floor)
+        for elev_id in unknown:
+            self._known_elevator(elev_id)
+        self._flush_calls(hall, cabin)
+        return len(data) // CALL_RECORD.size
+
+    @staticmethod
+    def pack_calls(requests: Iterable) -> bytes:
+        """Encode FloorRequest / CabinRequest objects as CALL_RECORDs."""
+        pack = CALL_RECORD.pack
+        return b"".join(
+            pack(CABIN, r.elevator_identifier, r.floor) if isinstance(r, CabinRequest)
+            else pack(HALL_UP if r.direction_up else HALL_DOWN, r.floor, 0)
+            for r in requests
+        )
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _flush_calls(self, hall: array, cabin: array) -> None:
+        if hall:
+            self.building.add_floor_requests(hall)
+            del hall[:]
+        if cabin:
+            self.building.add_cabin_requests(cabin)
+            del cabin[:]
+
+    def _stats(self, args) -> None:
+        metrics = self.building.metrics
+        if args == ["on"]:
+            self.building.enable_metrics()
+            self._print("metrics enabled")
+        elif args == ["off"]:
+            self.building.disable_metrics()
+            self._print("metrics disabled")
+        elif metrics is None:
+            self._print("metrics are disabled – use 'stats on'")
+        elif not args:
+            self._print(metrics.format())
+        elif len(args) == 2 and args[0] in {"json", "csv"} and not self.file_exports:
+            self._print("error: stats export to files is not available here – use 'stats'")
+        elif len(args) == 2 and args[0] in {"json", "csv"}:
+            export = metrics.to_json if args[0] == "json" else metrics.to_csv
+            try:
+                export(args[1])
+                self._print(f"metrics written to {args[1]}")
+            except OSError as exc:
+                self._print(f"[warning] cannot write {args[1]}: {exc}")
+        else:
+            self._print(self.HELP_TEXT)
+
+    def _known_elevator(self, elev_id: int) -> bool:
+        """Check a cabin call's elevator here, so the warning reaches this controller's client."""
+        if elev_id in self.building._by_id:
+            return True
+        self._print(f"[warning] Elevator with id {elev_id} not found")
+        return False
+
+    def _warn_outside(self, floor: int) -> None:
+        self._print(f"[warning] floor {floor} is outside the building "
+                    f"(0-{self.building.total_floors - 1})")
+
+    def _print(self, *args) -> None:
+        print(*args, file=self.out)
+
     @staticmethod
     def _to_int(token: str):
         """Return int(token) or None if conversion fails."""
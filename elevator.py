@@ -1,6 +1,7 @@
 from enum import Enum
-from collections import deque
-from typing import Deque
+from typing import Iterable, Optional
+
+from stops import StopSet
 
 class ElevatorState(Enum):
     IDLE = 0
@@ -8,58 +9,93 @@ class ElevatorState(Enum):
     MOVING_DOWN = 2
     DOORS_OPEN = 3
 
+class ServiceOrder(Enum):
+    FIFO = 0   # serve stops in the order they were requested
+    LOOK = 1   # collective control: sweep in one direction, then reverse
+
 class Elevator:
     """
     Represents a single elevator cab.
 
     State machine:
       • IDLE – waiting for work
-      • MOVING_UP / MOVING_DOWN – travelling toward first item in the queue
-      • DOORS_OPEN – doors stay open for one tick, then we pop the floor from the queue
+      • MOVING_UP / MOVING_DOWN – travelling toward the next stop
+      • DOORS_OPEN – doors stay open for one tick, then we drop the floor from the stops
+
+    The next stop is the oldest one (FIFO) or, with ServiceOrder.LOOK, the
+    nearest one in the direction of travel. A cab in a zoned bank only
+    accepts stops in `served_floors` (None = every floor).
     """
 
-    def __init__(self, identifier: int, current_floor: int, total_floors: int):
+    def __init__(
+        self,
+        identifier: int,
+        current_floor: int,
+        total_floors: int,
+        service_order: ServiceOrder = ServiceOrder.FIFO,
+        served_floors: Optional[Iterable[int]] = None,
+    ):
         self.identifier = identifier
         self.current_floor = current_floor
         self.total_floors = total_floors
+        self.service_order = service_order
         self.state: ElevatorState = ElevatorState.IDLE
-        self.target_floors: Deque[int] = deque()
+        self.target_floors = StopSet(fifo=service_order == ServiceOrder.FIFO)
+        self._heading_up = True
+        self.served_floors = None if served_floors is None else frozenset(served_floors)
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def add_target_floor(self, floor: int) -> None:
-        """Queue a new floor (if in range and not already queued)."""
-        if 0 <= floor <= self.total_floors and floor not in self.target_floors:
-            self.target_floors.append(floor)
+    def add_target_floor(self, floor: int, direction_up: Optional[bool] = None) -> None:
+        """Queue a new floor (if in range and served); `direction_up` is set for hallway calls."""
+        if 0 <= floor <= self.total_floors and self.serves(floor):
+            self.target_floors.add(floor, direction_up)
+
+    def serves(self, floor: int) -> bool:
+        """True if the cab can stop at `floor`."""
+        return self.served_floors is None or floor in self.served_floors
+
+    def next_target(self) -> Optional[int]:
+        """Floor the cab will stop at next, or None when there are no stops."""
+        if self.service_order == ServiceOrder.FIFO:
+            return self.target_floors.first()
+        # A travelling cab is already past its current floor.
+        floor = self.current_floor
+        if self.state == ElevatorState.MOVING_UP:
+            floor += 1
+        elif self.state == ElevatorState.MOVING_DOWN:
+            floor -= 1
+        return self.target_floors.look_next(floor, self._heading_up)
 
     def step(self) -> None:
         """Advance elevator state by one simulation tick."""
         if self.state == ElevatorState.IDLE:
             if self.target_floors:
-                self._set_direction_towards(self.target_floors[0])
+                self._set_direction_towards(self.next_target())
             return
 
         if self.state == ElevatorState.MOVING_UP:
+            target = self.next_target()
             self.current_floor += 1
-            if self.current_floor == self.target_floors[0]:
+            if self.current_floor == target:
                 self.state = ElevatorState.DOORS_OPEN
             return
 
         if self.state == ElevatorState.MOVING_DOWN:
+            target = self.next_target()
             self.current_floor -= 1
-            if self.current_floor == self.target_floors[0]:
+            if self.current_floor == target:
                 self.state = ElevatorState.DOORS_OPEN
             return
 
         if self.state == ElevatorState.DOORS_OPEN:
             # Remove the floor we just served
-            if self.target_floors:
-                self.target_floors.popleft()
+            self._serve_current_floor()
             # Decide next action
             if self.target_floors:
-                self._set_direction_towards(self.target_floors[0])
+                self._set_direction_towards(self.next_target())
             else:
                 self.state = ElevatorState.IDLE
 
@@ -67,14 +103,39 @@ class Elevator:
         """Return True when there is nothing to do."""
         return self.state == ElevatorState.IDLE and not self.target_floors
 
+    def ticks_until_transition(self) -> Optional[int]:
+        """Number of steps until the state changes, or None while idle with no work."""
+        if self.state in (ElevatorState.MOVING_UP, ElevatorState.MOVING_DOWN):
+            return abs(self.next_target() - self.current_floor)
+        if self.state == ElevatorState.DOORS_OPEN or self.target_floors:
+            return 1
+        return None
+
+    def coast(self, ticks: int) -> None:
+        """Travel `ticks` floors in the current direction without reaching the target."""
+        if self.state == ElevatorState.MOVING_UP:
+            self.current_floor += ticks
+        elif self.state == ElevatorState.MOVING_DOWN:
+            self.current_floor -= ticks
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _serve_current_floor(self) -> None:
+        if not self.target_floors:
+            return
+        if self.service_order == ServiceOrder.FIFO:
+            self.target_floors.popleft()
+        else:
+            self.target_floors.discard(self.current_floor)
+
     def _set_direction_towards(self, target: int) -> None:
         if target > self.current_floor:
             self.state = ElevatorState.MOVING_UP
+            self._heading_up = True
         elif target < self.current_floor:
             self.state = ElevatorState.MOVING_DOWN
+            self._heading_up = False
         else:
             self.state = ElevatorState.DOORS_OPEN
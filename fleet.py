@@ -0,0 +1,125 @@
+import numpy as np
+from typing import List, Optional
+
+from elevator import Elevator, ElevatorState, ServiceOrder
+
+# Integer codes stored in the state array (mirror ElevatorState values).
+_IDLE = ElevatorState.IDLE.value
+_UP = ElevatorState.MOVING_UP.value
+_DOWN = ElevatorState.MOVING_DOWN.value
+_DOORS = ElevatorState.DOORS_OPEN.value
+_NO_TARGET = -1
+
+
+class FleetElevator(Elevator):
+    """
+    Elevator-like view onto one slot of a FleetEngine.
+
+    `current_floor`, `state` and the LOOK heading live in the engine's NumPy
+    arrays; the stop set stays on the object, so views and strategies that
+    read an Elevator keep working unchanged.
+    """
+
+    def __init__(self, fleet: "FleetEngine", slot: int, identifier: int,
+                 current_floor: int, total_floors: int, service_order: ServiceOrder,
+                 served_floors=None):
+        self._fleet = fleet
+        self._slot = slot
+        super().__init__(identifier, current_floor, total_floors, service_order, served_floors)
+
+    @property
+    def current_floor(self) -> int:
+        return int(self._fleet.floors[self._slot])
+
+    @current_floor.setter
+    def current_floor(self, value: int) -> None:
+        self._fleet.floors[self._slot] = value
+
+    @property
+    def state(self) -> ElevatorState:
+        return ElevatorState(int(self._fleet.states[self._slot]))
+
+    @state.setter
+    def state(self, value: ElevatorState) -> None:
+        self._fleet.states[self._slot] = value.value
+
+    @property
+    def _heading_up(self) -> bool:
+        return bool(self._fleet.heading_up[self._slot])
+
+    @_heading_up.setter
+    def _heading_up(self, value: bool) -> None:
+        self._fleet.heading_up[self._slot] = value
+
+    def add_target_floor(self, floor: int, direction_up: Optional[bool] = None) -> None:
+        super().add_target_floor(floor, direction_up)
+        self._fleet.refresh_target(self._slot)
+
+
+class FleetEngine:
+    """
+    Array engine: keeps floor, state and head-of-queue target for the whole
+    fleet in NumPy arrays and advances every car with one batched update.
+
+    Produces the same trajectories as calling Elevator.step on each car.
+    """
+
+    def __init__(self, elevators: List[Elevator]):
+        n = len(elevators)
+        self.floors = np.zeros(n, dtype=np.int64)
+        self.states = np.full(n, _IDLE, dtype=np.int8)
+        self.targets = np.full(n, _NO_TARGET, dtype=np.int64)
+        self.heading_up = np.ones(n, dtype=bool)
+        self.cars: List[FleetElevator] = []
+        for slot, src in enumerate(elevators):
+            car = FleetElevator(self, slot, src.identifier, src.current_floor,
+                                src.total_floors, src.service_order, src.served_floors)
+            car.state = src.state
+            car._heading_up = src._heading_up
+            car.target_floors = src.target_floors.copy()
+            self.cars.append(car)
+            self.refresh_target(slot)
+
+    def refresh_target(self, slot: int) -> None:
+        """Re-read one car's next stop into the target array."""
+        target = self.cars[slot].next_target()
+        self.targets[slot] = _NO_TARGET if target is None else target
+
+    def coast(self, ticks: int) -> None:
+        """Move every travelling car `ticks` floors; no car may reach its target."""
+        self.floors[self.states == _UP] += ticks
+        self.floors[self.states == _DOWN] -= ticks
+
+    def step(self) -> None:
+        """Advance every car by one tick."""
+        floors, states, targets = self.floors, self.states, self.targets
+        has_target = targets != _NO_TARGET
+
+        # Masks are taken from the pre-tick state so each car makes one transition.
+        departing = (states == _IDLE) & has_target
+        moving_up = states == _UP
+        moving_down = states == _DOWN
+        doors = states == _DOORS
+
+        # Moving cars advance one floor and open their doors on arrival.
+        floors[moving_up] += 1
+        floors[moving_down] -= 1
+        arrived = (moving_up | moving_down) & (floors == targets)
+        states[arrived] = _DOORS
+
+        # Cars with open doors drop the floor just served; the stops live on
+        # the objects, so only these slots touch Python.
+        for slot in np.flatnonzero(doors):
+            self.cars[slot]._serve_current_floor()
+            self.refresh_target(slot)
+
+        # Idle cars with work and cars leaving a stop head for their next target.
+        choose = departing | (doors & (targets != _NO_TARGET))
+        going_up = choose & (targets > floors)
+        going_down = choose & (targets < floors)
+        states[choose] = _DOORS
+        states[going_up] = _UP
+        states[going_down] = _DOWN
+        self.heading_up[going_up] = True
+        self.heading_up[going_down] = False
+        states[doors & (targets == _NO_TARGET)] = _IDLE
@@ -0,0 +1,163 @@
+"""
+Bounded per-tick history of the fleet, for space-time plots and post-mortems.
+
+Every recorded tick is one row – the clock plus each car's floor, state and
+queue length – in a fixed-size NumPy ring buffer, so memory stays constant
+however long the run. With `spill` set, each time the ring fills up its rows
+are appended to a file first; the file is read back through np.memmap, so
+the complete run stays queryable without holding it in RAM.
+
+    history = building.enable_history(capacity=50_000, spill="run.hist")
+    building.advance(100_000)
+    past = history.window(20_000, 20_500)    # ticks, floors, states, queues
+"""
+import os
+import struct
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+_SPILL_MAGIC = b"ELHS\x01"
+_SPILL_HEADER = struct.Struct("<I")        # number of cars
+
+
+def row_dtype(cars: int) -> np.dtype:
+    return np.dtype([("tick", "<i8"), ("floor", "<i4", (cars,)),
+                     ("state", "i1", (cars,)), ("queue", "<i4", (cars,))])
+
+
+class Trajectory(NamedTuple):
+    """Recorded rows in tick order; per-car columns follow `identifiers`."""
+    identifiers: Tuple[int, ...]
+    ticks: np.ndarray          # (T,)
+    floors: np.ndarray         # (T, cars)
+    states: np.ndarray         # (T, cars) ElevatorState values
+    queues: np.ndarray         # (T, cars)
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    def car(self, identifier: int) -> "Trajectory":
+        """The same rows restricted to one car."""
+        col = self.identifiers.index(identifier)
+        return Trajectory((identifier,), self.ticks, self.floors[:, col:col + 1],
+                          self.states[:, col:col + 1], self.queues[:, col:col + 1])
+
+
+class FleetHistory:
+    """
+    Ring buffer of fleet rows, filled by Building.step / skip_ticks.
+
+    A skip_ticks span is stored as a single row at its end: cars only travel
+    during a skip, so drawing straight lines between rows is still exact.
+    """
+
+    def __init__(self, building, capacity: int = 100_000, spill: Optional[str] = None):
+        self.identifiers = tuple(e.identifier for e in building.elevators)
+        self.capacity = capacity
+        self._rows = np.zeros(capacity, dtype=row_dtype(len(self.identifiers)))
+        self._fleet = building._fleet
+        self.recorded = 0           # rows ever recorded
+        self.spilled = 0            # rows written to the spill file
+        self.spill_path = spill
+        self._spill_fh = None
+        self._spill_map: Optional[np.memmap] = None
+        if spill is not None:
+            self._spill_fh = open(spill, "wb")
+            self._spill_fh.write(_SPILL_MAGIC + _SPILL_HEADER.pack(len(self.identifiers)))
+        self.record(building)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def record(self, building) -> None:
+        pos = self.recorded % self.capacity
+        if pos == 0 and self.recorded and self._spill_fh is not None:
+            self._spill()                          # the ring is full and about to wrap
+        elevators = building.elevators
+        queues = [len(e.target_floors) for e in elevators]
+        if self._fleet is not None:
+            self._rows[pos] = (building.clock, self._fleet.floors, self._fleet.states, queues)
+        else:
+            self._rows[pos] = (building.clock, [e.current_floor for e in elevators],
+                               [e.state.value for e in elevators], queues)
+        self.recorded += 1
+
+    def _spill(self) -> None:
+        self._spill_fh.write(self._rows.tobytes())
+        self._spill_fh.flush()
+        self.spilled = self.recorded
+        self._spill_map = None                     # re-mapped on the next query
+
+    def close(self) -> None:
+        if self._spill_fh is not None:
+            self._spill_fh.close()
+            self._spill_fh = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        """Rows that can still be queried (ring plus spill file)."""
+        return self.recorded if self.spill_path else min(self.recorded, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        """Rows overwritten without being spilled."""
+        return self.recorded - len(self)
+
+    def first_tick(self) -> Optional[int]:
+        segments = self._segments()
+        return int(segments[0]["tick"][0]) if segments else None
+
+    def last_tick(self) -> Optional[int]:
+        return int(self._rows["tick"][(self.recorded - 1) % self.capacity]) if self.recorded else None
+
+    def window(self, start: Optional[int] = None, stop: Optional[int] = None) -> Trajectory:
+        """All retained rows with start <= tick < stop (open ends allowed)."""
+        parts = []
+        for segment in self._segments():
+            ticks = segment["tick"]
+            lo = 0 if start is None else int(np.searchsorted(ticks, start, "left"))
+            hi = len(ticks) if stop is None else int(np.searchsorted(ticks, stop, "left"))
+            if lo < hi:
+                parts.append(segment[lo:hi])
+        rows = np.concatenate(parts) if parts else self._rows[:0]
+        return Trajectory(self.identifiers, rows["tick"], rows["floor"], rows["state"], rows["queue"])
+
+    def car(self, identifier: int, start: Optional[int] = None, stop: Optional[int] = None) -> Trajectory:
+        return self.window(start, stop).car(identifier)
+
+    def _segments(self) -> List[np.ndarray]:
+        """Retained rows as tick-ordered chunks: spilled rows first, then the ring oldest to newest."""
+        n, cap = self.recorded, self.capacity
+        segments = []
+        in_ring = max(0, n - cap)                  # first row index still held in the ring
+        if self.spill_path and in_ring:
+            segments.append(self._spilled()[:in_ring])
+        pos = n % cap
+        if n > cap and pos:
+            segments.append(self._rows[pos:])
+            segments.append(self._rows[:pos])
+        else:
+            segments.append(self._rows[:min(n, cap)])
+        return [s for s in segments if len(s)]
+
+    def _spilled(self) -> np.ndarray:
+        if self._spill_map is None or len(self._spill_map) != self.spilled:
+            self._spill_map = open_spill(self.spill_path)
+        return self._spill_map
+
+
+def open_spill(path: str) -> np.memmap:
+    """Memory-map the rows of a spill file (read-only) as a structured array."""
+    with open(path, "rb") as fh:
+        head = fh.read(len(_SPILL_MAGIC) + _SPILL_HEADER.size)
+    if not head.startswith(_SPILL_MAGIC):
+        raise ValueError(f"{path} is not a fleet history spill file")
+    (cars,) = _SPILL_HEADER.unpack_from(head, len(_SPILL_MAGIC))
+    dtype = row_dtype(cars)
+    count = (os.path.getsize(path) - len(head)) // dtype.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=len(head), shape=(count,))
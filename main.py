@@ -1,34 +1,45 @@
+import contextlib
+import io
 import sys
-from tkinter import Tk
-from elevator import Elevator
+import registry
+from elevator import Elevator, ServiceOrder
 from building import Building
-from strategy import NearestElevatorStrategy
+from strategy import DispatchStrategy, NearestElevatorStrategy
 from controller import Controller
-from view_cli import ViewCLI
-from view_gui import ViewGUI
 
+# Views and run modes are imported on first use, so headless runs never load tkinter.
 
-def create_building() -> Building:
-    """Factory that returns a Building with two elevators and the default strategy."""
-    total_floors = 6                                  # change if you need more
+
+def create_building(
+    total_floors: int = 6,
+    elevator_count: int = 2,
+    strategy: DispatchStrategy = None,
+    array_engine: bool = False,
+    service_order: ServiceOrder = ServiceOrder.FIFO,
+    packed_queue: bool = False,
+) -> Building:
+    """Factory that returns a Building (6 floors, 2 elevators, nearest strategy by default)."""
     elevators = [
-        Elevator(1, 0, total_floors - 1),
-        Elevator(2, 0, total_floors - 1),
+        Elevator(ident, 0, total_floors - 1, service_order)
+        for ident in range(1, elevator_count + 1)
     ]
-    return Building(total_floors, elevators, NearestElevatorStrategy())
+    return Building(total_floors, elevators, strategy or NearestElevatorStrategy(),
+                    array_engine=array_engine, packed_queue=packed_queue)
 
 
 def run_gui(building: Building) -> None:
     """Launch the Tkinter GUI."""
+    from tkinter import Tk
+
     root = Tk()
     root.title("Mini-Elevator Simulator")
-    ViewGUI(root, building)
+    registry.view_class("gui")(root, building)
     root.mainloop()
 
 
 def run_cli(building: Building) -> None:
     """Start the text-based interface."""
-    ViewCLI(building)                # registers itself as observer
+    registry.view_class("cli")(building)    # registers itself as observer
     controller = Controller(building)
     print("CLI mode – type 'help' for commands, Ctrl+C to quit.")
     try:
@@ -39,9 +50,97 @@ def run_cli(building: Building) -> None:
         print("\nBye!")
 
 
+def run_script(building: Building, source: str, view_mode: str = "full") -> None:
+    """
+    Run CLI commands non-interactively from a file ('-' = stdin).
+
+    Commands are read in bulk and all output goes through one block-buffered
+    writer, so long scripts are not bound by terminal I/O. sys.stdout is
+    rebound to that writer for the run, so warnings printed by the model
+    stay in order with the view output.
+    """
+    out = io.open(sys.stdout.fileno(), "w", buffering=1 << 16,
+                  encoding="utf-8", closefd=False)
+    sys.stdout.flush()
+    registry.view_class("cli")(building, view_mode, out)
+    controller = Controller(building, out)
+    stream = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        with contextlib.redirect_stdout(out):
+            controller.process_batch(stream)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        out.flush()
+
+
+def run_batch(building: Building, scenario_path: str, event_driven: bool = False,
+              stats: bool = False) -> None:
+    """Run a scenario file headless (no observers) and print summary stats."""
+    from scenario import load_scenario, run_scenario, format_summary
+    from event_sim import run_scenario_events
+
+    calls = load_scenario(scenario_path)
+    if stats:
+        building.enable_metrics()
+    runner = run_scenario_events if event_driven else run_scenario
+    summary = runner(building, calls)
+    print(format_summary(summary))
+    if stats:
+        print(building.metrics.format())
+    if building.dispatch_cache is not None:
+        print(format_summary(building.dispatch_cache.stats()))
+
+
+def run_server(building: Building, host: str, port: int, tick_seconds: float) -> None:
+    """Serve the Controller command protocol over TCP until Ctrl+C."""
+    import asyncio
+    from server import serve
+
+    try:
+        asyncio.run(serve(building, host, port, tick_seconds))
+    except KeyboardInterrupt:
+        print("\nBye!")
+
+
 if __name__ == "__main__":
     # Mode selection: 1) command-line arg, 2) interactive prompt
     mode = sys.argv[1].lower() if len(sys.argv) > 1 else ""
+
+    if mode == "batch":
+        # python main.py batch SCENARIO [--array] [--packed] [--cache] [--events] [--look] [--stats]
+        args = sys.argv[2:]
+        paths = [a for a in args if not a.startswith("--")]
+        if len(paths) != 1:
+            sys.exit("usage: python main.py batch SCENARIO [--array] [--packed] [--cache] [--events] [--look] [--stats]")
+        order = ServiceOrder.LOOK if "--look" in args else ServiceOrder.FIFO
+        building = create_building(array_engine="--array" in args, service_order=order,
+                                   packed_queue="--packed" in args)
+        if "--cache" in args:
+            building.enable_dispatch_cache()
+        run_batch(building, paths[0], event_driven="--events" in args, stats="--stats" in args)
+        sys.exit(0)
+
+    if mode == "cli" and (len(sys.argv) > 2 or not sys.stdin.isatty()):
+        # python main.py cli [--script FILE|-] [--view full|diff|summary]
+        args = sys.argv[2:]
+        options = dict(zip(args[::2], args[1::2]))
+        if len(args) % 2 or set(options) - {"--script", "--view"}:
+            sys.exit("usage: python main.py cli [--script FILE|-] [--view full|diff|summary]")
+        run_script(create_building(), options.get("--script", "-"),
+                   options.get("--view", "full"))
+        sys.exit(0)
+
+    if mode == "serve":
+        # python main.py serve [--host H] [--port P] [--tick SECONDS]
+        args = sys.argv[2:]
+        options = dict(zip(args[::2], args[1::2]))
+        if len(args) % 2 or set(options) - {"--host", "--port", "--tick"}:
+            sys.exit("usage: python main.py serve [--host H] [--port P] [--tick SECONDS]")
+        run_server(create_building(), options.get("--host", "127.0.0.1"),
+                   int(options.get("--port", 8765)), float(options.get("--tick", 1.0)))
+        sys.exit(0)
+
     if mode not in {"gui", "cli"}:
         mode = input("Choose interface (gui/cli) [gui]: ").strip().lower() or "gui"
 
@@ -0,0 +1,191 @@
+import csv
+import json
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from elevator import ElevatorState
+
+PHASES = ("dispatch", "elevators", "notify")
+
+
+class Histogram:
+    """Exact histogram of non-negative integer samples (tick counts)."""
+
+    def __init__(self):
+        self._counts: Dict[int, int] = defaultdict(int)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value: int) -> None:
+        self._counts[value] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> int:
+        """Smallest sample v such that at least p% of samples are <= v."""
+        if not self.count:
+            return 0
+        rank = p / 100 * self.count
+        seen = 0
+        for value in sorted(self._counts):
+            seen += self._counts[value]
+            if seen >= rank:
+                return value
+        return self.max
+
+    def buckets(self) -> List[Tuple[int, int]]:
+        return sorted(self._counts.items())
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": round(self.mean(), 3),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": self.max,
+        }
+
+
+class Metrics:
+    """
+    Per-tick instrumentation for a Building.
+
+    Collects wall time per step phase, call-to-pickup waits for hallway calls,
+    press-to-arrival journey times for cabin calls (both in ticks, from the
+    created_at stamp on the request) and counters for car travel and stops.
+    Building only calls into it when metrics are enabled.
+    """
+
+    def __init__(self):
+        self.phase_seconds: Dict[str, float] = {name: 0.0 for name in PHASES}
+        self.ticks = 0
+        self.hall_calls = 0
+        self.cabin_calls = 0
+        self.dropped_calls = 0  # hall calls no car could take (zoned fleets)
+        self.floors_travelled = 0
+        self.stops = 0
+        self.wait = Histogram()
+        self.journey = Histogram()
+        self._pickups: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self._dropoffs: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self._floors: List[int] = []
+
+    # ------------------------------------------------------------------
+    # Hooks called by Building
+    # ------------------------------------------------------------------
+    def on_dispatch(self, elevator, request, clock: int) -> None:
+        self.hall_calls += 1
+        if elevator.state == ElevatorState.DOORS_OPEN and elevator.current_floor == request.floor:
+            # Served by doors already open here: this tick's move closes them
+            # without after_move ever seeing them open again.
+            self.wait.add(clock - request.created_at)
+            return
+        self._pickups[(elevator.identifier, request.floor)].append(request.created_at)
+
+    def on_dropped_call(self, request) -> None:
+        self.hall_calls += 1
+        self.dropped_calls += 1
+
+    def on_cabin_request(self, elevator, request, clock: int) -> None:
+        self.cabin_calls += 1
+        if elevator.state == ElevatorState.DOORS_OPEN and elevator.current_floor == request.floor:
+            self.journey.add(clock - request.created_at)   # same case as in on_dispatch
+            return
+        self._dropoffs[(elevator.identifier, request.floor)].append(request.created_at)
+
+    def before_move(self, elevators) -> None:
+        self._floors = [e.current_floor for e in elevators]
+
+    def after_move(self, elevators, clock: int) -> None:
+        self.ticks += 1
+        for elevator, before in zip(elevators, self._floors):
+            floor = elevator.current_floor
+            self.floors_travelled += abs(floor - before)
+            if elevator.state == ElevatorState.DOORS_OPEN:
+                # Doors stay open for exactly one tick, so this is a new stop.
+                self.stops += 1
+                key = (elevator.identifier, floor)
+                for created in self._pickups.pop(key, ()):
+                    self.wait.add(clock - created)
+                for created in self._dropoffs.pop(key, ()):
+                    self.journey.add(clock - created)
+
+    def on_skip(self, elevators, ticks: int) -> None:
+        self.ticks += ticks
+        moving = (ElevatorState.MOVING_UP, ElevatorState.MOVING_DOWN)
+        self.floors_travelled += ticks * sum(1 for e in elevators if e.state in moving)
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phase_seconds[name] += seconds
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def to_dict(self) -> dict:
+        per_tick = {
+            f"{name}_us_per_tick": round(sec / self.ticks * 1e6, 3) if self.ticks else 0.0
+            for name, sec in self.phase_seconds.items()
+        }
+        return {
+            "ticks": self.ticks,
+            "hall_calls": self.hall_calls,
+            "cabin_calls": self.cabin_calls,
+            "dropped_calls": self.dropped_calls,
+            "floors_travelled": self.floors_travelled,
+            "stops": self.stops,
+            **per_tick,
+            "wait_ticks": self.wait.summary(),
+            "journey_ticks": self.journey.summary(),
+        }
+
+    def format(self) -> str:
+        lines = []
+        for key, value in self.to_dict().items():
+            if isinstance(value, dict):
+                value = " ".join(f"{k}={v}" for k, v in value.items())
+            lines.append(f"{key:<22} {value}")
+        return "\n".join(lines)
+
+    def to_json(self, path: str) -> None:
+        data = self.to_dict()
+        data["wait_histogram"] = self.wait.buckets()
+        data["journey_histogram"] = self.journey.buckets()
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2)
+
+    def to_csv(self, path: str) -> None:
+        """One 'metric,value' row per scalar; histograms as 'wait[ticks],count' rows."""
+        with open(path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["metric", "value"])
+            for key, value in self.to_dict().items():
+                if isinstance(value, dict):
+                    for sub, v in value.items():
+                        writer.writerow([f"{key}.{sub}", v])
+                else:
+                    writer.writerow([key, value])
+            for name, hist in (("wait", self.wait), ("journey", self.journey)):
+                for ticks, count in hist.buckets():
+                    writer.writerow([f"{name}[{ticks}]", count])
+
+
+class PhaseClock:
+    """Tiny helper so Building can time its phases with one call per boundary."""
+
+    __slots__ = ("_metrics", "_last")
+
+    def __init__(self, metrics: Metrics):
+        self._metrics = metrics
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        self._metrics.add_phase(phase, now - self._last)
+        self._last = now
@@ -0,0 +1,205 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:                    # asyncio is only imported once an ASYNCIO observer exists
+    import asyncio
+
+from elevator import ElevatorState
+from requests import FloorRequest
+
+
+class Delivery(Enum):
+    SYNC = 0      # called inside Building.step with the live Building
+    THREAD = 1    # called on a background thread with the latest snapshot
+    ASYNCIO = 2   # called (or awaited) on an asyncio loop with the latest snapshot
+
+
+class ElevatorSnapshot(NamedTuple):
+    identifier: int
+    current_floor: int
+    state: ElevatorState
+    target_floors: Tuple[int, ...]
+
+
+class BuildingSnapshot(NamedTuple):
+    """Immutable copy of what the views read from a Building."""
+    clock: int
+    total_floors: int
+    elevators: Tuple[ElevatorSnapshot, ...]
+    hallway_queue: Tuple[FloorRequest, ...]
+
+
+def snapshot(building) -> BuildingSnapshot:
+    return BuildingSnapshot(
+        building.clock,
+        building.total_floors,
+        tuple(
+            ElevatorSnapshot(e.identifier, e.current_floor, e.state, tuple(e.target_floors))
+            for e in building.elevators
+        ),
+        tuple(building.hallway_queue),
+    )
+
+
+class Subscription(ABC):
+    """
+    Handle returned by ObserverBus.subscribe.
+
+    Queued kinds rate-limit on the consumer side: offer() always overwrites
+    the mailbox, and the consumer waits 1 / max_rate after each callback, so
+    the newest state is still delivered once the limit allows.
+    """
+
+    def __init__(self, callback: Callable, max_rate: Optional[float] = None):
+        self.callback = callback
+        self._interval = 1.0 / max_rate if max_rate else 0.0
+
+    @abstractmethod
+    def offer(self, update) -> None:
+        """Hand over the newest state (the Building for SYNC, a snapshot otherwise)."""
+
+    def close(self) -> None:
+        pass
+
+
+class _SyncSubscription(Subscription):
+    """Called inline with the live Building."""
+
+    def offer(self, building) -> None:
+        self.callback(building)
+
+
+class _ThreadSubscription(Subscription):
+    """Latest-wins mailbox drained by a daemon thread."""
+
+    def __init__(self, callback, max_rate=None):
+        super().__init__(callback, max_rate)
+        self._latest: Optional[BuildingSnapshot] = None
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="observer", daemon=True)
+        self._thread.start()
+
+    def offer(self, snap):
+        with self._cond:
+            self._latest = snap          # overwrite: only the newest state matters
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._latest is None and not self._closed:
+                    self._cond.wait()
+                if self._latest is None:
+                    return
+                snap, self._latest = self._latest, None
+            self.callback(snap)
+            if self._interval:
+                time.sleep(self._interval)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+
+class _AsyncioSubscription(Subscription):
+    """Latest-wins mailbox drained by a task on the given event loop."""
+
+    def __init__(self, callback, max_rate=None, loop: "asyncio.AbstractEventLoop" = None):
+        super().__init__(callback, max_rate)
+        self._loop = loop
+        self._latest: Optional[BuildingSnapshot] = None
+        self._draining = False
+        self._lock = threading.Lock()
+
+    def offer(self, snap):
+        with self._lock:
+            self._latest = snap
+            if self._draining:
+                return
+            self._draining = True
+        self._loop.call_soon_threadsafe(self._start_drain)
+
+    def _start_drain(self):
+        self._loop.create_task(self._drain())
+
+    async def _drain(self):
+        import asyncio
+        while True:
+            with self._lock:
+                snap, self._latest = self._latest, None
+                if snap is None:
+                    self._draining = False
+                    return
+            result = self.callback(snap)
+            if asyncio.iscoroutine(result):
+                await result
+            if self._interval:
+                await asyncio.sleep(self._interval)
+
+
+class ObserverBus:
+    """
+    Fan-out of Building notifications.
+
+    Synchronous subscribers get the live Building, as before. Queued
+    subscribers get an immutable BuildingSnapshot through a latest-wins
+    mailbox, so a slow or rate-limited consumer never holds up the
+    simulation – one snapshot is built per publish and shared by all of
+    them, and the last one published is always delivered.
+    """
+
+    def __init__(self):
+        self._sync: List[Subscription] = []
+        self._queued: List[Subscription] = []
+
+    def subscribe(
+        self,
+        callback: Callable,
+        delivery: Delivery = Delivery.SYNC,
+        max_rate: Optional[float] = None,
+        loop: Optional["asyncio.AbstractEventLoop"] = None,
+    ) -> Subscription:
+        if delivery == Delivery.SYNC:
+            sub = _SyncSubscription(callback)
+            self._sync.append(sub)
+            return sub
+        if delivery == Delivery.THREAD:
+            sub = _ThreadSubscription(callback, max_rate)
+        else:
+            import asyncio
+            sub = _AsyncioSubscription(callback, max_rate, loop or asyncio.get_running_loop())
+        self._queued.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        for group in (self._sync, self._queued):
+            if sub in group:
+                group.remove(sub)
+        sub.close()
+
+    def publish(self, building) -> None:
+        for sub in self._sync:
+            sub.offer(building)
+        if self._queued:
+            snap = snapshot(building)
+            for sub in self._queued:
+                sub.offer(snap)
+
+    def flush(self, building) -> None:
+        """Hand the current state to every queued subscriber (SYNC callbacks are not called)."""
+        if self._queued:
+            snap = snapshot(building)
+            for sub in self._queued:
+                sub.offer(snap)
+
+    def close(self) -> None:
+        """Stop background consumers after they drain their last snapshot."""
+        for sub in self._queued:
+            sub.close()
+        self._queued.clear()
@@ -0,0 +1,287 @@
+"""
+Checkpoints and a deterministic replay log for a Building.
+
+A checkpoint is a compact binary snapshot of the whole simulation state
+(clock, cars with their stops, hallway queue, strategy). The event log is an
+append-only file of fixed-size records – every request, strategy switch and
+tick – read back through mmap. Any tick can be reconstructed by loading the
+nearest earlier checkpoint and re-applying the log from the offset stored in
+that checkpoint; replay runs without observers, so it is much faster than
+real time.
+"""
+import glob
+import mmap
+import os
+import struct
+from typing import List, Optional, Tuple
+
+import registry
+from building import Building
+from elevator import Elevator, ElevatorState, ServiceOrder
+from requests import FloorRequest, CabinRequest, PackedFloorQueue
+from stops import StopSet
+
+# ----------------------------------------------------------------------
+# Checkpoint format
+# ----------------------------------------------------------------------
+_CKPT_MAGIC = b"ELCK\x03"
+_HEADER = struct.Struct("<QQIBII")      # clock, log offset, floors, engine flags, cars, hall calls
+_ARRAY_ENGINE, _PACKED_QUEUE, _DISPATCH_CACHE = 1, 2, 4  # with _DISPATCH_CACHE its maxsize (U32) follows the strategy name
+_CAR = struct.Struct("<iiiBBB")         # id, floor, top floor, state, service order, heading up
+_HALL = struct.Struct("<iiq")           # floor, call code (see _encode_call), created_at (-1 = unknown)
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+
+def _pack_int(value: int) -> bytes:
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "little")
+    return _U16.pack(len(raw)) + raw
+
+
+def _pack_str(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    return _U16.pack(len(raw)) + raw
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._pos = 0
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        values = fmt.unpack_from(self._data, self._pos)
+        self._pos += fmt.size
+        return values
+
+    def raw(self) -> bytes:
+        (size,) = self.unpack(_U16)
+        chunk = bytes(self._data[self._pos:self._pos + size])
+        self._pos += size
+        return chunk
+
+
+def save_checkpoint(building: Building, log_offset: int = 0) -> bytes:
+    """Serialise the building; `log_offset` marks where replay resumes in the log."""
+    parts = [
+        _CKPT_MAGIC,
+        _HEADER.pack(building.clock, log_offset, building.total_floors,
+                     (building._fleet is not None) * _ARRAY_ENGINE
+                     | isinstance(building.hallway_queue, PackedFloorQueue) * _PACKED_QUEUE
+                     | (building.dispatch_cache is not None) * _DISPATCH_CACHE,
+                     len(building.elevators),
+                     len(building.hallway_queue)),
+        _pack_str(_strategy_class_name(building.dispatch_strategy)),
+    ]
+    if building.dispatch_cache is not None:
+        parts.append(_U32.pack(building.dispatch_cache.maxsize))
+    for e in building.elevators:
+        parts.append(_CAR.pack(e.identifier, e.current_floor, e.total_floors, e.state.value,
+                               e.service_order.value, e._heading_up))
+        cabin, up, down, order = e.target_floors.dump()
+        served = 0 if e.served_floors is None else sum(1 << f for f in e.served_floors)
+        parts += [_pack_int(cabin), _pack_int(up), _pack_int(down), _pack_int(served)]
+        if order is None:
+            parts.append(_U32.pack(0xFFFFFFFF))
+        else:
+            parts.append(_U32.pack(len(order)) + struct.pack(f"<{len(order)}i", *order))
+    for req in building.hallway_queue:
+        created = -1 if req.created_at is None else req.created_at
+        parts.append(_HALL.pack(req.floor, _encode_call(req), created))
+    return b"".join(parts)
+
+
+def load_checkpoint(data: bytes) -> Tuple[Building, int]:
+    """Rebuild a Building from save_checkpoint() output; returns (building, log offset)."""
+    if not data.startswith(_CKPT_MAGIC):
+        raise ValueError("not a building checkpoint")
+    reader = _Reader(data)
+    reader._pos = len(_CKPT_MAGIC)
+    clock, log_offset, floors, flags, n_cars, n_hall = reader.unpack(_HEADER)
+    strategy_cls = registry.strategy_by_class_name(reader.raw().decode("utf-8"))
+    cache_size = reader.unpack(_U32)[0] if flags & _DISPATCH_CACHE else None
+
+    elevators = []
+    for _ in range(n_cars):
+        ident, floor, top, state, order_kind, heading = reader.unpack(_CAR)
+        masks = [int.from_bytes(reader.raw(), "little") for _ in range(4)]
+        served = masks.pop() or None
+        if served is not None:
+            served = [f for f in range(served.bit_length()) if served >> f & 1]
+        elevator = Elevator(ident, floor, top, ServiceOrder(order_kind), served)
+        elevator.state = ElevatorState(state)
+        elevator._heading_up = bool(heading)
+        (count,) = reader.unpack(_U32)
+        order = None if count == 0xFFFFFFFF else list(reader.unpack(struct.Struct(f"<{count}i")))
+        elevator.target_floors = StopSet.load(*masks, order)
+        elevators.append(elevator)
+
+    building = Building(floors, elevators, strategy_cls(), array_engine=bool(flags & _ARRAY_ENGINE),
+                        packed_queue=bool(flags & _PACKED_QUEUE))
+    if cache_size is not None:
+        building.enable_dispatch_cache(cache_size)
+    building.clock = clock
+    for _ in range(n_hall):
+        floor, code, created = reader.unpack(_HALL)
+        building.hallway_queue.append(FloorRequest(floor, bool(code & 1), None if created < 0 else created,
+                                                   _decode_destination(code)))
+    return building, log_offset
+
+
+def _strategy_class_name(strategy) -> str:
+    """Class name stored in checkpoints; wrappers resolve to what they wrap."""
+    return registry.strategy_class(registry.strategy_name(strategy)).__name__
+
+
+def _encode_call(request: FloorRequest) -> int:
+    """direction_up in bit 0, destination + 1 above it (0 = no destination)."""
+    destination = 0 if request.destination is None else request.destination + 1
+    return destination << 1 | bool(request.direction_up)
+
+
+def _decode_destination(code: int) -> Optional[int]:
+    return (code >> 1) - 1 if code >> 1 else None
+
+
+# ----------------------------------------------------------------------
+# Event log
+# ----------------------------------------------------------------------
+_RECORD = struct.Struct("<Bii")          # kind, arg1, arg2
+FLOOR_REQUEST, CABIN_REQUEST, STEP, SKIP, STRATEGY = range(5)
+
+
+class EventLog:
+    """
+    Append-only log of everything that changes a Building from outside.
+
+    Building calls the record_* hooks when `building.journal` is set.
+    Records are fixed size, so readers can mmap the file and walk it from any
+    offset without parsing what comes before.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, "ab")
+        self._pack = _RECORD.pack
+
+    @property
+    def offset(self) -> int:
+        return self._fh.tell()
+
+    def record_floor_request(self, request: FloorRequest) -> None:
+        self._fh.write(self._pack(FLOOR_REQUEST, request.floor, _encode_call(request)))
+
+    def record_cabin_request(self, request: CabinRequest) -> None:
+        self._fh.write(self._pack(CABIN_REQUEST, request.elevator_identifier, request.floor))
+
+    def record_step(self) -> None:
+        self._fh.write(self._pack(STEP, 0, 0))
+
+    def record_skip(self, ticks: int) -> None:
+        self._fh.write(self._pack(SKIP, ticks, 0))
+
+    def record_strategy(self, strategy) -> None:
+        code = registry.strategy_names().index(registry.strategy_name(strategy))
+        self._fh.write(self._pack(STRATEGY, code, 0))
+
+    def flush(self) -> None:
+        self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+def read_log(path: str, offset: int = 0):
+    """Yield (offset, kind, arg1, arg2) for every record from `offset` on, via mmap."""
+    if os.path.getsize(path) <= offset:
+        return
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        unpack_from, size = _RECORD.unpack_from, _RECORD.size
+        end = len(mm) - (len(mm) - offset) % size    # ignore a torn trailing record
+        for pos in range(offset, end, size):
+            yield (pos, *unpack_from(mm, pos))
+
+
+def apply_log(building: Building, path: str, offset: int, until_tick: Optional[int] = None) -> int:
+    """Re-apply log records to `building` until its clock reaches `until_tick`; returns the next offset."""
+    for pos, kind, arg1, arg2 in read_log(path, offset):
+        if until_tick is not None and building.clock >= until_tick:
+            return pos
+        if kind == FLOOR_REQUEST:
+            building.add_floor_request(FloorRequest(arg1, bool(arg2 & 1), destination=_decode_destination(arg2)))
+        elif kind == CABIN_REQUEST:
+            building.add_cabin_request(CabinRequest(arg1, arg2))
+        elif kind == STEP:
+            building.step()
+        elif kind == SKIP:
+            ticks = arg1 if until_tick is None else min(arg1, until_tick - building.clock)
+            building.skip_ticks(ticks)
+        elif kind == STRATEGY:
+            building.set_dispatch_strategy(registry.create_strategy(registry.strategy_names()[arg1]))
+    return os.path.getsize(path)
+
+
+# ----------------------------------------------------------------------
+# Recording and replay
+# ----------------------------------------------------------------------
+class Recorder:
+    """
+    Journals a Building into `directory`: events.log plus ckpt-<tick>.bin
+    every `checkpoint_every` ticks (and one at attach time).
+    """
+
+    def __init__(self, building: Building, directory: str, checkpoint_every: int = 1000):
+        os.makedirs(directory, exist_ok=True)
+        self.building = building
+        self.directory = directory
+        self.checkpoint_every = checkpoint_every
+        self.log = EventLog(os.path.join(directory, "events.log"))
+        building.journal = self.log
+        self._last_checkpoint = None
+        self.checkpoint()
+        building.add_observer(self._on_tick)
+
+    def checkpoint(self) -> str:
+        self.log.flush()
+        path = os.path.join(self.directory, f"ckpt-{self.building.clock:012d}.bin")
+        with open(path, "wb") as fh:
+            fh.write(save_checkpoint(self.building, self.log.offset))
+        self._last_checkpoint = self.building.clock
+        return path
+
+    def _on_tick(self, building: Building) -> None:
+        if building.clock - self._last_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+
+    def close(self) -> None:
+        self.building.journal = None
+        self.log.close()
+
+
+def list_checkpoints(directory: str) -> List[Tuple[int, str]]:
+    found = []
+    for path in glob.glob(os.path.join(directory, "ckpt-*.bin")):
+        tick = int(os.path.basename(path)[5:-4])
+        found.append((tick, path))
+    return sorted(found)
+
+
+def replay(directory: str, tick: int) -> Building:
+    """Reconstruct the building as it was right after `tick` ticks."""
+    candidates = [c for c in list_checkpoints(directory) if c[0] <= tick]
+    if not candidates:
+        raise ValueError(f"no checkpoint at or before tick {tick} in {directory}")
+    with open(candidates[-1][1], "rb") as fh:
+        building, offset = load_checkpoint(fh.read())
+    apply_log(building, os.path.join(directory, "events.log"), offset, until_tick=tick)
+    return building
+
+
+if __name__ == "__main__":
+    # python persistence.py DIRECTORY TICK – print the state recorded at TICK
+    import sys
+    from view_cli import ViewCLI
+
+    if len(sys.argv) != 3:
+        sys.exit("usage: python persistence.py DIRECTORY TICK")
+    restored = replay(sys.argv[1], int(sys.argv[2]))
+    ViewCLI(restored).render(restored)
@@ -0,0 +1,106 @@
+"""
+Name-based registry of dispatch strategies and views.
+
+Entries are (module, attribute) pairs, so looking up the available names is
+free and an implementation is imported only when it is first asked for – a
+headless run never imports tkinter. Controller, the GUI, sweeps, benchmarks
+and the replay log all pick strategies from here.
+
+    register_strategy("mine", "my_module", "MyStrategy", "My strategy")
+    building.set_dispatch_strategy(create_strategy("mine"))
+"""
+import importlib
+from typing import Dict, List, NamedTuple, Optional
+
+
+class Entry(NamedTuple):
+    module: str
+    attribute: str
+    label: str
+
+
+_STRATEGIES: Dict[str, Entry] = {}
+_VIEWS: Dict[str, Entry] = {}
+_loaded: Dict[Entry, type] = {}
+
+
+def _load(entry: Entry) -> type:
+    cls = _loaded.get(entry)
+    if cls is None:
+        cls = _loaded[entry] = getattr(importlib.import_module(entry.module), entry.attribute)
+    return cls
+
+
+# ----------------------------------------------------------------------
+# Dispatch strategies
+# ----------------------------------------------------------------------
+def register_strategy(name: str, module: str, attribute: str, label: Optional[str] = None) -> None:
+    """Make a DispatchStrategy available by `name`. Append only: the order numbers replay-log records."""
+    _STRATEGIES[name] = Entry(module, attribute, label or name)
+
+
+def strategy_names() -> List[str]:
+    return list(_STRATEGIES)
+
+
+def strategy_label(name: str) -> str:
+    return _STRATEGIES[name].label
+
+
+def strategy_class(name: str) -> type:
+    try:
+        entry = _STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"unknown strategy {name!r}; choose from {strategy_names()}") from None
+    return _load(entry)
+
+
+def create_strategy(name: str):
+    """Instantiate the strategy registered as `name`."""
+    return strategy_class(name)()
+
+
+def strategy_name(strategy) -> str:
+    """Registered name of a strategy instance (wrappers are named after what they wrap)."""
+    while hasattr(strategy, "inner"):
+        strategy = strategy.inner
+    attribute = type(strategy).__name__
+    for name, entry in _STRATEGIES.items():
+        if entry.attribute == attribute:
+            return name
+    raise ValueError(f"{attribute} is not a registered strategy")
+
+
+def strategy_by_class_name(attribute: str) -> type:
+    """Strategy class from its class name, as stored in checkpoints."""
+    for entry in _STRATEGIES.values():
+        if entry.attribute == attribute:
+            return _load(entry)
+    raise ValueError(f"{attribute} is not a registered strategy")
+
+
+# ----------------------------------------------------------------------
+# Views
+# ----------------------------------------------------------------------
+def register_view(name: str, module: str, attribute: str, label: Optional[str] = None) -> None:
+    _VIEWS[name] = Entry(module, attribute, label or name)
+
+
+def view_names() -> List[str]:
+    return list(_VIEWS)
+
+
+def view_class(name: str) -> type:
+    try:
+        entry = _VIEWS[name]
+    except KeyError:
+        raise ValueError(f"unknown view {name!r}; choose from {view_names()}") from None
+    return _load(entry)
+
+
+register_strategy("nearest", "strategy", "NearestElevatorStrategy", "Nearest")
+register_strategy("leastbusy", "strategy", "LeastBusyElevatorStrategy", "Least busy")
+register_strategy("eta", "strategy", "EtaDispatchStrategy", "Fastest ETA")
+
+register_view("cli", "view_cli", "ViewCLI", "Console")
+register_view("gui", "view_gui", "ViewGUI", "Tkinter")
@@ -1,9 +1,18 @@
+from array import array
+from typing import Iterable, Iterator, Optional
+
+
 class FloorRequest:
     """Represents a hallway call: floor + desired direction."""
 
-    def __init__(self, floor: int, direction_up: bool):
+    __slots__ = ("floor", "direction_up", "created_at", "destination")
+
+    def __init__(self, floor: int, direction_up: bool, created_at: Optional[int] = None,
+                 destination: Optional[int] = None):
         self.floor = floor
         self.direction_up = direction_up
+        self.created_at = created_at  # tick the call was made; stamped by Building
+        self.destination = destination  # known only in zoned buildings (see zoning.py)
 
     # Helpful for debugging / printing
     def __repr__(self) -> str:
@@ -14,9 +23,148 @@ class FloorRequest:
 class CabinRequest:
     """Represents a button press inside a specific elevator cab."""
 
-    def __init__(self, elevator_identifier: int, floor: int):
+    __slots__ = ("elevator_identifier", "floor", "created_at")
+
+    def __init__(self, elevator_identifier: int, floor: int, created_at: Optional[int] = None):
         self.elevator_identifier = elevator_identifier
         self.floor = floor
+        self.created_at = created_at  # tick the button was pressed; stamped by Building
 
     def __repr__(self) -> str:
         return f"CabinRequest(E{self.elevator_identifier}→{self.floor})"
+
+
+# ----------------------------------------------------------------------
+# Packed hallway queue
+# ----------------------------------------------------------------------
+# One int64 per call: bit 0 direction up, bits 1-16 floor, bits 17-33
+# destination + 1, bits 34-62 created_at + 1 (0 = unknown).
+_FLOOR_SHIFT, _DEST_SHIFT, _TIME_SHIFT = 1, 17, 34
+_FLOOR_MASK, _DEST_MASK, _TIME_MASK = (1 << 16) - 1, (1 << 17) - 1, (1 << 29) - 1
+
+
+def pack_floor_request(request: FloorRequest) -> int:
+    created = 0 if request.created_at is None else request.created_at + 1
+    destination = 0 if request.destination is None else request.destination + 1
+    if not (0 <= request.floor <= _FLOOR_MASK and 0 <= destination <= _DEST_MASK
+            and 0 <= created <= _TIME_MASK):
+        raise ValueError(f"{request!r} (created_at={request.created_at}, "
+                         f"destination={request.destination}) does not fit a packed call")
+    return (created << _TIME_SHIFT | destination << _DEST_SHIFT
+            | request.floor << _FLOOR_SHIFT | bool(request.direction_up))
+
+
+def requests_from_codes(codes: Iterable[int]) -> Iterator[FloorRequest]:
+    """
+    Decode packed calls into one reused FloorRequest: each yielded request is
+    only valid until the next one is produced, so dispatching a packed queue
+    allocates nothing per call.
+    """
+    request = FloorRequest(0, False)
+    for code in codes:
+        created = code >> _TIME_SHIFT
+        destination = code >> _DEST_SHIFT & _DEST_MASK
+        request.floor = code >> _FLOOR_SHIFT & _FLOOR_MASK
+        request.direction_up = bool(code & 1)
+        request.created_at = created - 1 if created else None
+        request.destination = destination - 1 if destination else None
+        yield request
+
+
+def unpack_floor_request(code: int) -> FloorRequest:
+    created = code >> _TIME_SHIFT
+    destination = code >> _DEST_SHIFT & _DEST_MASK
+    return FloorRequest(code >> _FLOOR_SHIFT & _FLOOR_MASK, bool(code & 1),
+                        created - 1 if created else None,
+                        destination - 1 if destination else None)
+
+
+class PackedFloorQueue:
+    """
+    Drop-in replacement for the deque of FloorRequests in Building.hallway_queue.
+
+    Calls are stored as packed int64s in a growable ring buffer (8 bytes per
+    pending call instead of an object each); FloorRequest objects are only
+    built when the queue is read.
+    """
+
+    def __init__(self, capacity: int = 64):
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._buf = array("q", bytes(8 * size))
+        self._head = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __bool__(self) -> bool:
+        return self._len > 0
+
+    def __iter__(self) -> Iterator[FloorRequest]:
+        buf, mask = self._buf, len(self._buf) - 1
+        for i in range(self._len):
+            yield unpack_floor_request(buf[(self._head + i) & mask])
+
+    def __repr__(self) -> str:
+        return f"PackedFloorQueue({list(self)})"
+
+    def append(self, request: FloorRequest) -> None:
+        self.append_code(pack_floor_request(request))
+
+    def append_code(self, code: int) -> None:
+        if self._len == len(self._buf):
+            self._grow()
+        self._buf[(self._head + self._len) & (len(self._buf) - 1)] = code
+        self._len += 1
+
+    def extend(self, requests: Iterable[FloorRequest]) -> None:
+        self._extend_packed(array("q", map(pack_floor_request, requests)))
+
+    def extend_codes(self, codes: array, created_at: int) -> None:
+        """Queue calls given as (floor << 1) | direction_up, all made at `created_at`."""
+        if not 0 <= created_at + 1 <= _TIME_MASK:
+            raise ValueError(f"created_at {created_at} does not fit a packed call")
+        if codes and not (0 <= min(codes) and max(codes) >> _DEST_SHIFT == 0):
+            raise ValueError(f"floor out of range in packed calls (0..{_FLOOR_MASK})")
+        stamp = (created_at + 1) << _TIME_SHIFT
+        self._extend_packed(array("q", [stamp | code for code in codes]))
+
+    def _extend_packed(self, packed: array) -> None:
+        while self._len + len(packed) > len(self._buf):
+            self._grow()
+        size = len(self._buf)
+        tail = (self._head + self._len) & (size - 1)
+        first = min(len(packed), size - tail)           # up to the end of the buffer, then wrap
+        self._buf[tail:tail + first] = packed[:first]
+        self._buf[:len(packed) - first] = packed[first:]
+        self._len += len(packed)
+
+    def drain_codes(self) -> array:
+        """Remove every pending call and return the packed codes, oldest first."""
+        buf, end = self._buf, self._head + self._len
+        if end <= len(buf):
+            codes = buf[self._head:end]
+        else:
+            codes = buf[self._head:] + buf[:end - len(buf)]
+        self.clear()
+        return codes
+
+    def popleft(self) -> FloorRequest:
+        if not self._len:
+            raise IndexError("pop from an empty queue")
+        code = self._buf[self._head]
+        self._head = (self._head + 1) & (len(self._buf) - 1)
+        self._len -= 1
+        return unpack_floor_request(code)
+
+    def clear(self) -> None:
+        self._head = 0
+        self._len = 0
+
+    def _grow(self) -> None:
+        size = len(self._buf)
+        ordered = self._buf[self._head:] + self._buf[:self._head]
+        self._buf = ordered + array("q", bytes(8 * size))
+        self._head = 0
@@ -0,0 +1,95 @@
+import time
+from typing import List, Tuple, Union, Optional
+
+from building import Building
+from requests import FloorRequest, CabinRequest
+
+Call = Union[FloorRequest, CabinRequest]
+
+
+def parse_scenario(lines) -> List[Tuple[int, Call]]:
+    """
+    Parse timestamped calls, one per line:
+
+        TICK fr FLOOR up|down      hallway call
+        TICK cr ELEV_ID FLOOR      cabin button press
+
+    Blank lines and lines starting with '#' are ignored.
+    Returns (tick, request) pairs sorted by tick (stable for equal ticks).
+    """
+    calls: List[Tuple[int, Call]] = []
+    for lineno, raw in enumerate(lines, 1):
+        parts = raw.split("#", 1)[0].split()
+        if not parts:
+            continue
+        try:
+            tick, cmd = int(parts[0]), parts[1].lower()
+            if cmd == "fr" and len(parts) == 4 and parts[3].lower() in {"up", "down"}:
+                calls.append((tick, FloorRequest(int(parts[2]), parts[3].lower() == "up")))
+            elif cmd == "cr" and len(parts) == 4:
+                calls.append((tick, CabinRequest(int(parts[2]), int(parts[3]))))
+            else:
+                raise ValueError(cmd)
+        except (IndexError, ValueError):
+            raise ValueError(f"line {lineno}: cannot parse {raw.strip()!r}") from None
+    calls.sort(key=lambda item: item[0])
+    return calls
+
+
+def load_scenario(path: str) -> List[Tuple[int, Call]]:
+    """Read and parse a scenario file."""
+    with open(path, encoding="utf-8") as fh:
+        return parse_scenario(fh)
+
+
+def run_scenario(
+    building: Building,
+    calls: List[Tuple[int, Call]],
+    max_ticks: Optional[int] = None,
+) -> dict:
+    """
+    Feed the calls into the building and step it until every call has been
+    submitted and the building is idle again (or `max_ticks` is reached).
+
+    Calls stamped with tick t are submitted just before the t-th step.
+    Returns summary statistics of the run.
+    """
+    hall_calls = cabin_calls = 0
+    tick = 0
+    i, n = 0, len(calls)
+    started = time.perf_counter()
+
+    while i < n or not building.is_idle():
+        if max_ticks is not None and tick >= max_ticks:
+            break
+        while i < n and calls[i][0] <= tick:
+            request = calls[i][1]
+            if isinstance(request, FloorRequest):
+                building.add_floor_request(request)
+                hall_calls += 1
+            else:
+                building.add_cabin_request(request)
+                cabin_calls += 1
+            i += 1
+        building.step()
+        tick += 1
+
+    elapsed = time.perf_counter() - started
+    return {
+        "ticks": tick,
+        "hall_calls": hall_calls,
+        "cabin_calls": cabin_calls,
+        "unsent_calls": n - i,
+        "elapsed_s": elapsed,
+        "ticks_per_s": tick / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def format_summary(summary: dict) -> str:
+    """Render run statistics as aligned 'key: value' lines."""
+    width = max(len(k) for k in summary)
+    lines = []
+    for key, value in summary.items():
+        text = f"{value:.3f}" if isinstance(value, float) else str(value)
+        lines.append(f"{key.ljust(width)} : {text}")
+    return "\n".join(lines)
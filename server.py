@@ -0,0 +1,184 @@
+"""
+Asyncio TCP front-end speaking the Controller command grammar.
+
+Every client line is a Controller command (fr, cr, strategy, stats, help;
+stats are only reported inline, never written to files on the server);
+calls land in the building's queues and are served by the next tick, which
+the server drives on its own timer. Extra commands:
+
+    status        current state, one line
+    subscribe     push the state line after every tick
+    unsubscribe   stop pushes
+    quit          close the connection
+
+Pushes are encoded once per tick and written without awaiting; a client
+whose socket buffer is backed up simply misses updates until it catches up,
+so slow readers never stall the tick loop.
+"""
+import asyncio
+from typing import Dict, Optional, Set
+
+from building import Building
+from controller import Controller
+
+MAX_BUFFERED = 64 * 1024   # bytes queued for a subscriber before updates are dropped
+
+SERVER_HELP = (
+    "server commands:\n"
+    "  subscribe / unsubscribe    state line pushed after every tick\n"
+    "  quit                       close the connection\n"
+    "  (tick and run-until-idle are driven by the server)\n"
+)
+
+
+def status_line(building: Building) -> str:
+    cars = " ".join(
+        f"E{e.identifier}:{e.current_floor}:{e.state.name}:{','.join(map(str, e.target_floors))}"
+        for e in building.elevators
+    )
+    hall = ",".join(f"{r.floor}{'u' if r.direction_up else 'd'}" for r in building.hallway_queue)
+    return f"tick {building.clock} {cars} hall:{hall}"
+
+
+class _ClientOut:
+    """File-like adapter so Controller output goes back to its client."""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self._writer = writer
+
+    def write(self, text: str) -> None:
+        self._writer.write(text.encode("utf-8"))
+
+    def flush(self) -> None:
+        pass
+
+
+class ElevatorServer:
+    def __init__(self, building: Building, tick_seconds: float = 1.0):
+        self.building = building
+        self.tick_seconds = tick_seconds
+        self._subscribers: Set[asyncio.StreamWriter] = set()
+        self._clients: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._ticker: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        self._server = await asyncio.start_server(self._handle_client, host, port, backlog=4096)
+        self._ticker = asyncio.create_task(self._tick_loop())
+        return self._server
+
+    async def stop(self) -> None:
+        if self._ticker:
+            self._ticker.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        clients = list(self._clients.items())
+        for writer, _ in clients:
+            writer.close()
+        await asyncio.gather(*(task for _, task in clients), return_exceptions=True)
+        self._subscribers.clear()
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+    async def _tick_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            next_tick += self.tick_seconds
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            self.tick()
+
+    def tick(self) -> None:
+        """Step the building (serving every call received since the last tick) and push state."""
+        self.building.step()
+        if self._subscribers:
+            self._broadcast((status_line(self.building) + "\n").encode("utf-8"))
+
+    def _broadcast(self, data: bytes) -> None:
+        for writer in list(self._subscribers):
+            transport = writer.transport
+            if transport.is_closing():
+                self._subscribers.discard(writer)
+            elif transport.get_write_buffer_size() < MAX_BUFFERED:
+                writer.write(data)
+
+    # ------------------------------------------------------------------
+    # Clients
+    # ------------------------------------------------------------------
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients[writer] = asyncio.current_task()
+        controller = Controller(self.building, out=_ClientOut(writer), file_exports=False)
+        try:
+            while True:
+                line = await self._read_line(reader, writer)
+                if not line:
+                    break
+                command = line.decode("utf-8", "replace").strip()
+                if not self._handle_command(command, controller, writer):
+                    break
+                if writer.transport.get_write_buffer_size() > MAX_BUFFERED:
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._subscribers.discard(writer)
+            self._clients.pop(writer, None)
+            writer.close()
+
+    @staticmethod
+    async def _read_line(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bytes:
+        """Next command line (b"" at EOF); over-long lines are dropped whole with an error reply."""
+        too_long = False
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as exc:
+                return b"" if too_long else exc.partial
+            except asyncio.LimitOverrunError as exc:
+                await reader.readexactly(exc.consumed)     # discard what is buffered of it
+                too_long = True
+                continue
+            if not too_long:
+                return line
+            writer.write(b"error: line too long\n")
+            too_long = False
+
+    def _handle_command(self, command: str, controller: Controller,
+                        writer: asyncio.StreamWriter) -> bool:
+        """Run one command; returns False when the client asked to quit."""
+        word = command.split(maxsplit=1)[0].lower() if command else ""
+        if word == "quit":
+            return False
+        if word == "status":
+            writer.write((status_line(self.building) + "\n").encode("utf-8"))
+        elif word == "subscribe":
+            self._subscribers.add(writer)
+        elif word == "unsubscribe":
+            self._subscribers.discard(writer)
+        elif word in {"tick", "run-until-idle"}:
+            writer.write(b"error: ticks are driven by the server\n")
+        elif word == "help":
+            controller.process_user_input(command)
+            writer.write(SERVER_HELP.encode("utf-8"))
+        elif word:
+            controller.process_user_input(command)
+        return True
+
+
+async def serve(building: Building, host: str, port: int, tick_seconds: float) -> None:
+    server = ElevatorServer(building, tick_seconds)
+    await server.start(host, port)
+    print(f"serving on {host}:{server.port} – tick every {tick_seconds}s, Ctrl+C to quit")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
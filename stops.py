@@ -0,0 +1,182 @@
+from collections import deque
+from typing import Deque, Iterator, List, Optional, Tuple
+
+
+def _lowest(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+def _highest(mask: int) -> int:
+    return mask.bit_length() - 1
+
+
+class StopSet:
+    """
+    Floors an elevator still has to stop at, stored as int bitmasks.
+
+    Insert, membership test and removal are O(1); the next stop in a given
+    direction is a couple of bit operations. Cabin calls and hallway calls
+    going up / down are kept in separate masks so LOOK servicing can honour
+    the direction of a hallway call. With `fifo=True` the insertion order is
+    kept as well, for first-come-first-served cabs. `version` is bumped on
+    every change, so callers can cache anything derived from the stops.
+    """
+
+    __slots__ = ("_cabin", "_up", "_down", "_count", "_order", "version")
+
+    def __init__(self, fifo: bool = True):
+        self._cabin = 0
+        self._up = 0
+        self._down = 0
+        self._count = 0
+        self._order: Optional[Deque[int]] = deque() if fifo else None
+        self.version = 0
+
+    # ------------------------------------------------------------------
+    # Container protocol
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __contains__(self, floor: int) -> bool:
+        return floor >= 0 and bool((self.mask >> floor) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        """FIFO order for FIFO sets, ascending floors otherwise."""
+        if self._order is not None:
+            return iter(self._order)
+        return self._ascending()
+
+    def __repr__(self) -> str:
+        return f"StopSet({list(self)})"
+
+    def _ascending(self) -> Iterator[int]:
+        mask = self.mask
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    @property
+    def mask(self) -> int:
+        """Bitmask of every floor with a pending stop."""
+        return self._cabin | self._up | self._down
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+    def add(self, floor: int, direction_up: Optional[bool] = None) -> bool:
+        """
+        Add a stop; `direction_up` is None for cabin calls.
+        Returns True if the floor was not a stop before.
+        """
+        bit = 1 << floor
+        new = not (self.mask & bit)
+        self.version += 1
+        if direction_up is None:
+            self._cabin |= bit
+        elif direction_up:
+            self._up |= bit
+        else:
+            self._down |= bit
+        if new:
+            self._count += 1
+            if self._order is not None:
+                self._order.append(floor)
+        return new
+
+    def discard(self, floor: int) -> None:
+        """Remove every call at `floor`."""
+        bit = 1 << floor
+        if not (self.mask & bit):
+            return
+        keep = ~bit
+        self.version += 1
+        self._cabin &= keep
+        self._up &= keep
+        self._down &= keep
+        self._count -= 1
+        if self._order is not None:
+            self._order.remove(floor)
+
+    def popleft(self) -> int:
+        """Remove and return the oldest stop (FIFO sets only)."""
+        floor = self._order[0]
+        self.discard(floor)
+        return floor
+
+    def copy(self) -> "StopSet":
+        clone = StopSet(fifo=self._order is not None)
+        clone._cabin, clone._up, clone._down = self._cabin, self._up, self._down
+        clone._count = self._count
+        if self._order is not None:
+            clone._order.extend(self._order)
+        return clone
+
+    def dump(self) -> Tuple[int, int, int, Optional[List[int]]]:
+        """(cabin mask, up mask, down mask, FIFO order or None) – for checkpoints."""
+        order = list(self._order) if self._order is not None else None
+        return self._cabin, self._up, self._down, order
+
+    def signature(self) -> tuple:
+        """Hashable value equal for two sets exactly when they serve stops alike."""
+        if self._order is not None:
+            return tuple(self._order)
+        return self._cabin, self._up, self._down
+
+    @classmethod
+    def load(cls, cabin: int, up: int, down: int, order: Optional[List[int]]) -> "StopSet":
+        """Inverse of dump()."""
+        stops = cls(fifo=order is not None)
+        stops._cabin, stops._up, stops._down = cabin, up, down
+        stops._count = bin(cabin | up | down).count("1")
+        if order is not None:
+            stops._order.extend(order)
+        return stops
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def first(self) -> Optional[int]:
+        """Oldest stop for FIFO sets, lowest floor otherwise; None when empty."""
+        if not self._count:
+            return None
+        if self._order is not None:
+            return self._order[0]
+        return _lowest(self.mask)
+
+    def look_next(self, floor: int, heading_up: bool) -> Optional[int]:
+        """
+        Next stop under LOOK / collective control.
+
+        Keep going in the current direction, stopping at cabin calls and at
+        hallway calls that want to travel the same way; the farthest opposite
+        hallway call ahead is the turning point. With nothing ahead, reverse.
+        """
+        if not self._count:
+            return None
+        at_or_above = ~((1 << floor) - 1)
+        at_or_below = (1 << (floor + 1)) - 1
+        if heading_up:
+            order = ((at_or_above, True), (at_or_below, False))
+        else:
+            order = ((at_or_below, False), (at_or_above, True))
+        for window, up in order:
+            if up:
+                with_flow = (self._cabin | self._up) & window
+                if with_flow:
+                    return _lowest(with_flow)
+                against = self._down & window
+                if against:
+                    return _highest(against)
+            else:
+                with_flow = (self._cabin | self._down) & window
+                if with_flow:
+                    return _highest(with_flow)
+                against = self._up & window
+                if against:
+                    return _lowest(against)
+        return None
@@ -1,6 +1,10 @@
+import heapq
+import itertools
 from abc import ABC, abstractmethod
-from typing import List
-from elevator import Elevator
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Iterable
+from elevator import Elevator, ElevatorState, ServiceOrder
 from requests import FloorRequest
 
 
@@ -12,8 +16,157 @@ class DispatchStrategy(ABC):
         """Return the chosen elevator for the given hallway request."""
         raise NotImplementedError
 
+    def select_elevators(self, elevators: List[Elevator], requests: Iterable[FloorRequest]) -> List[Elevator]:
+        """
+        Assign a drained batch of hallway calls in order.
 
-class NearestElevatorStrategy(DispatchStrategy):
+        Each call's floor is queued on its chosen elevator before the next call
+        is considered, exactly as if select_elevator were used one at a time.
+        Returns the chosen elevators in request order. `requests` may yield
+        one reused object (packed queues), so read a request, never keep it.
+        """
+        chosen = []
+        for request in requests:
+            elevator = self.select_elevator(elevators, request)
+            elevator.add_target_floor(request.floor, request.direction_up)
+            chosen.append(elevator)
+        return chosen
+
+    def decision_key(self, elevators: List[Elevator], request: FloorRequest) -> tuple:
+        """
+        Hashable summary of everything select_elevator may look at (see
+        CachedDispatchStrategy): equal keys must mean the same choice, by
+        position in `elevators`. Strategies that read less override this with
+        a coarser key, which makes cache hits likelier.
+        """
+        return (request.floor, request.direction_up, request.destination,
+                tuple((e.identifier, e.current_floor, e.state, e._heading_up, e.target_floors.signature())
+                      for e in elevators))
+
+
+class _FloorIndex:
+    """
+    Elevators bucketed by floor, with the occupied floors kept sorted.
+
+    Each bucket is a lazy heap ordered by a caller-supplied rank, so the best
+    cab on the floors nearest to a request is found in O(log E).
+    """
+
+    def __init__(self):
+        self._floors: List[int] = []                 # sorted occupied floors
+        self._count: Dict[int, int] = {}
+        self._heaps: Dict[int, list] = {}
+        self._where: Dict[Elevator, Tuple[int, tuple]] = {}
+        self._seq = itertools.count()
+
+    def __bool__(self) -> bool:
+        return bool(self._where)
+
+    def put(self, elevator: Elevator, floor: int, rank: tuple) -> None:
+        entry = (floor, rank)
+        old = self._where.get(elevator)
+        if old == entry:
+            return
+        if old is not None:
+            self._release(old[0])
+        self._where[elevator] = entry
+        if self._count.get(floor, 0) == 0:
+            insort(self._floors, floor)
+            self._count[floor] = 0
+        self._count[floor] += 1
+        heapq.heappush(self._heaps.setdefault(floor, []), (rank, next(self._seq), elevator))
+
+    def remove(self, elevator: Elevator) -> None:
+        old = self._where.pop(elevator, None)
+        if old is not None:
+            self._release(old[0])
+
+    def _release(self, floor: int) -> None:
+        self._count[floor] -= 1
+        if self._count[floor] == 0:
+            del self._count[floor]
+            del self._heaps[floor]
+            self._floors.pop(bisect_left(self._floors, floor))
+
+    def _best_at(self, floor: int) -> Tuple[tuple, Elevator]:
+        heap = self._heaps[floor]
+        while self._where.get(heap[0][2]) != (floor, heap[0][0]):
+            heapq.heappop(heap)                      # stale entry
+        return heap[0][0], heap[0][2]
+
+    def nearest(self, floor: int) -> Elevator:
+        """Return the lowest-rank cab among those closest to `floor`."""
+        floors = self._floors
+        pos = bisect_left(floors, floor)
+        candidates = []
+        if pos < len(floors):
+            candidates.append(floors[pos])
+        if pos > 0:
+            candidates.append(floors[pos - 1])
+        best_dist = min(abs(f - floor) for f in candidates)
+        return min(
+            self._best_at(f) for f in candidates if abs(f - floor) == best_dist
+        )[1]
+
+
+class _IndexedStrategy(DispatchStrategy):
+    """
+    Base for strategies backed by an incrementally maintained index.
+
+    The index remembers each cab's last seen (floor, queue length); on every
+    batch only cabs that moved or whose queue changed are re-indexed, and each
+    assignment then costs O(log E) instead of a scan of the whole fleet.
+    """
+
+    def __init__(self):
+        self._fleet: List[Elevator] = []
+        self._known: Dict[Elevator, Tuple[int, int]] = {}
+
+    def select_elevators(self, elevators: List[Elevator], requests: Iterable[FloorRequest]) -> List[Elevator]:
+        self._sync(elevators)
+        chosen = []
+        for request in requests:
+            elevator = self._pick(request)
+            elevator.add_target_floor(request.floor, request.direction_up)
+            self._update(elevator)
+            chosen.append(elevator)
+        return chosen
+
+    def _sync(self, elevators: List[Elevator]) -> None:
+        if elevators is not self._fleet or len(self._known) != len(elevators):
+            self._fleet = elevators
+            self._known.clear()
+            self._reset_index()
+        for elevator in elevators:
+            self._update(elevator)
+
+    def decision_key(self, elevators: List[Elevator], request: FloorRequest) -> tuple:
+        # Nearest and least-busy only compare distance to the call, load and identifier.
+        floor = request.floor
+        return tuple((e.identifier, abs(e.current_floor - floor), len(e.target_floors)) for e in elevators)
+
+    def _update(self, elevator: Elevator) -> None:
+        seen = (elevator.current_floor, len(elevator.target_floors))
+        old = self._known.get(elevator)
+        if seen != old:
+            self._known[elevator] = seen
+            self._reindex(elevator, old, seen)
+
+    # Subclass hooks ----------------------------------------------------
+    @abstractmethod
+    def _reset_index(self) -> None:
+        """Drop the whole index; called when the fleet changes."""
+
+    @abstractmethod
+    def _reindex(self, elevator: Elevator, old, new: Tuple[int, int]) -> None:
+        """Move `elevator` from key `old` (None if not indexed yet) to `new`."""
+
+    @abstractmethod
+    def _pick(self, request: FloorRequest) -> Elevator:
+        """Best indexed elevator for the request."""
+
+
+class NearestElevatorStrategy(_IndexedStrategy):
     """Pick the elevator whose cab is geographically closest to the request."""
 
     def select_elevator(self, elevators: List[Elevator], request: FloorRequest) -> Elevator:
@@ -28,7 +181,19 @@ class NearestElevatorStrategy(DispatchStrategy):
         )
 
 
-class LeastBusyElevatorStrategy(DispatchStrategy):
+    # Index: all cabs sorted by floor, ranked by (queue length, identifier).
+    def _reset_index(self) -> None:
+        self._by_floor = _FloorIndex()
+
+    def _reindex(self, elevator: Elevator, old, new: Tuple[int, int]) -> None:
+        floor, queue_len = new
+        self._by_floor.put(elevator, floor, (queue_len, elevator.identifier))
+
+    def _pick(self, request: FloorRequest) -> Elevator:
+        return self._by_floor.nearest(request.floor)
+
+
+class LeastBusyElevatorStrategy(_IndexedStrategy):
     """Pick the elevator with the fewest pending target floors."""
 
     def select_elevator(self, elevators: List[Elevator], request: FloorRequest) -> Elevator:
@@ -41,3 +206,183 @@ class LeastBusyElevatorStrategy(DispatchStrategy):
                 e.identifier,                          # tertiary: deterministic tie‑break
             ),
         )
+
+    # Index: a heap of queue lengths, each length owning a floor index of
+    # its cabs ranked by identifier.
+    def _reset_index(self) -> None:
+        self._by_load: Dict[int, _FloorIndex] = {}
+        self._loads: List[int] = []
+        self._queued_loads = set()
+
+    def _reindex(self, elevator: Elevator, old, new: Tuple[int, int]) -> None:
+        if old is not None:
+            self._by_load[old[1]].remove(elevator)
+        floor, queue_len = new
+        bucket = self._by_load.get(queue_len)
+        if bucket is None:
+            bucket = self._by_load[queue_len] = _FloorIndex()
+        if queue_len not in self._queued_loads:
+            self._queued_loads.add(queue_len)
+            heapq.heappush(self._loads, queue_len)
+        bucket.put(elevator, floor, (elevator.identifier,))
+
+    def _pick(self, request: FloorRequest) -> Elevator:
+        while not self._by_load[self._loads[0]]:
+            self._queued_loads.discard(heapq.heappop(self._loads))  # no cab left at this load
+        return self._by_load[self._loads[0]].nearest(request.floor)
+
+
+# Ticks a stop costs on top of travel: the cab spends one tick in DOORS_OPEN.
+DOOR_TICKS = 1
+
+
+class EtaDispatchStrategy(DispatchStrategy):
+    """
+    Pick the elevator that can serve the request soonest.
+
+    Each cab's queued route is walked once – stop order as the cab itself
+    would pick it (FIFO or LOOK), one tick per floor plus the door dwell at
+    every stop – and the result is cached until that cab's state, heading or
+    stop set changes. A moving cab keeps its cached route: it is simply that
+    many floors further along it. The score is the estimated ticks until the
+    doors open at the request floor, plus one door dwell for every queued stop
+    the new call would delay.
+    """
+
+    def __init__(self):
+        self._routes: Dict[Elevator, tuple] = {}    # per car, whatever subset is dispatched
+
+    def select_elevator(self, elevators: List[Elevator], request: FloorRequest) -> Elevator:
+        return min(
+            elevators,
+            key=lambda e: (
+                self.cost(e, request.floor, request.direction_up),
+                len(e.target_floors),
+                e.identifier,
+            ),
+        )
+
+    def cost(self, elevator: Elevator, floor: int, direction_up: Optional[bool] = None) -> int:
+        """Estimated ticks until `elevator` opens its doors at `floor`, plus the delay it imposes."""
+        key = (elevator.state, elevator.target_floors.version, elevator._heading_up)
+        cached = self._routes.get(elevator)
+        if cached is None or cached[0] != key:
+            cached = self._routes[elevator] = (key, elevator.current_floor, *self._route(elevator))
+        _, origin, legs, arrivals, free_at, end_floor = cached
+        moved = abs(elevator.current_floor - origin)
+
+        if elevator.state == ElevatorState.DOORS_OPEN and floor == elevator.current_floor:
+            return 0
+        if floor in arrivals:
+            return arrivals[floor] - moved
+        if elevator.service_order == ServiceOrder.LOOK:
+            for i, (start, depart, end, arrive) in enumerate(legs):
+                up = end > start
+                if direction_up is not None and direction_up != up:
+                    continue
+                if (start < floor < end) if up else (end < floor < start):
+                    eta = depart + abs(floor - start) - moved
+                    if eta > 0:
+                        return eta + DOOR_TICKS * (len(legs) - i)
+        return free_at + abs(floor - end_floor) - moved
+
+    @staticmethod
+    def _route(elevator: Elevator) -> tuple:
+        """
+        Walk the queued stops: returns (legs, arrivals, free_at, end_floor) where
+        legs are (start, depart tick, end, arrival tick) and arrivals maps each
+        stop to the tick its doors open.
+        """
+        stops = elevator.target_floors.copy()
+        fifo = elevator.service_order == ServiceOrder.FIFO
+        floor, heading = elevator.current_floor, elevator._heading_up
+        legs, arrivals = [], {}
+
+        if elevator.state in (ElevatorState.MOVING_UP, ElevatorState.MOVING_DOWN):
+            tick, target = 0, elevator.next_target()
+        else:
+            if elevator.state == ElevatorState.DOORS_OPEN and stops:
+                stops.popleft() if fifo else stops.discard(floor)   # served this tick
+            tick = 1                                                 # deciding costs a tick
+            target = None
+        while stops:
+            if target is None:
+                target = stops.first() if fifo else stops.look_next(floor, heading)
+            if target != floor:
+                heading = target > floor
+            arrive = tick + abs(target - floor)
+            legs.append((floor, tick, target, arrive))
+            arrivals[target] = arrive
+            stops.discard(target)
+            floor, tick, target = target, arrive + DOOR_TICKS, None
+        return legs, arrivals, tick, floor
+
+
+class CachedDispatchStrategy(DispatchStrategy):
+    """
+    Memoises another strategy's decisions in a bounded LRU.
+
+    The key is the inner strategy's decision_key – the request and a compact
+    per-car state – so a hit returns exactly what the inner strategy would
+    have chosen, provided its choice depends on nothing else. Small buildings
+    revisit the same few fleet states over and over; there most calls are
+    answered by one dict lookup.
+    """
+
+    def __init__(self, inner: DispatchStrategy, maxsize: int = 4096):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._decisions: "OrderedDict[tuple, int]" = OrderedDict()
+        self.maxsize = maxsize
+        self.reset(inner)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        """Shrinking the limit evicts the least recently used decisions right away."""
+        self._maxsize = value
+        self._trim()
+
+    def _trim(self) -> None:
+        decisions = self._decisions
+        while len(decisions) > self._maxsize:
+            decisions.popitem(last=False)
+            self.evictions += 1
+
+    def reset(self, inner: DispatchStrategy) -> None:
+        """Wrap a different strategy; every remembered decision is dropped, the counters are kept."""
+        self.inner = inner
+        self._key = inner.decision_key
+        self._decisions.clear()
+
+    def select_elevator(self, elevators: List[Elevator], request: FloorRequest) -> Elevator:
+        key = self._key(elevators, request)
+        decisions = self._decisions
+        index = decisions.get(key)
+        if index is not None:
+            self.hits += 1
+            decisions.move_to_end(key)
+            return elevators[index]
+        self.misses += 1
+        elevator = self.inner.select_elevator(elevators, request)
+        if elevator is not None:
+            decisions[key] = elevators.index(elevator)
+            if len(decisions) > self._maxsize:
+                self._trim()
+        return elevator
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "cache_lookups": self.hits + self.misses,
+            "cache_hit_rate": self.hit_rate(),
+            "cache_entries": len(self._decisions),
+            "cache_evictions": self.evictions,
+        }
@@ -0,0 +1,129 @@
+"""
+Parameter sweep: run independent simulations for every combination of
+(floors, elevator count, strategy, traffic seed) on a process pool and
+collect per-run metrics into one table.
+
+    python sweep.py --floors 6 20 --elevators 2 4 --seeds 1 2 3 --csv out.csv
+"""
+import argparse
+import csv
+import itertools
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Tuple
+
+from elevator import ElevatorState
+from main import create_building
+from requests import FloorRequest, CabinRequest
+from scenario import Call, run_scenario
+import registry
+
+COLUMNS = ("floors", "elevators", "strategy", "seed", "calls",
+           "ticks", "floors_travelled", "stops")
+
+
+class SweepPoint(NamedTuple):
+    floors: int
+    elevators: int
+    strategy: str
+    seed: int
+
+
+def make_calls(floors: int, elevators: int, seed: int, count: int, mean_gap: float) -> List[Tuple[int, Call]]:
+    """
+    Random hallway and cabin calls with exponential gaps between arrivals.
+
+    The stream depends only on (floors, elevators, seed), so every strategy
+    sees the same traffic and a run never depends on which worker executes it.
+    """
+    rng = random.Random(f"{seed}-{floors}-{elevators}")
+    calls: List[Tuple[int, Call]] = []
+    tick = 0.0
+    for _ in range(count):
+        tick += rng.expovariate(1.0 / mean_gap)
+        if rng.random() < 0.6:
+            floor = rng.randrange(floors)
+            up = floor == 0 or (floor < floors - 1 and rng.random() < 0.5)
+            calls.append((int(tick), FloorRequest(floor, up)))
+        else:
+            calls.append((int(tick), CabinRequest(rng.randint(1, elevators), rng.randrange(floors))))
+    return calls
+
+
+def run_point(point: SweepPoint, calls: int = 500, mean_gap: float = 2.0) -> dict:
+    """Simulate one grid point and return its metrics row."""
+    building = create_building(point.floors, point.elevators, registry.create_strategy(point.strategy))
+    counters = {"floors_travelled": 0, "stops": 0}
+    last = [(e.current_floor, e.state) for e in building.elevators]
+
+    def count_motion(b) -> None:
+        for i, elevator in enumerate(b.elevators):
+            floor, state = last[i]
+            counters["floors_travelled"] += abs(elevator.current_floor - floor)
+            if elevator.state == ElevatorState.DOORS_OPEN and state != ElevatorState.DOORS_OPEN:
+                counters["stops"] += 1
+            last[i] = (elevator.current_floor, elevator.state)
+
+    building.add_observer(count_motion)
+    summary = run_scenario(building, make_calls(*point[:2], point.seed, calls, mean_gap))
+    return {
+        **point._asdict(),
+        "calls": summary["hall_calls"] + summary["cabin_calls"],
+        "ticks": summary["ticks"],
+        **counters,
+    }
+
+
+def _run_point_star(args) -> dict:
+    return run_point(*args)
+
+
+def run_sweep(points: List[SweepPoint], workers: int = None, calls: int = 500,
+              mean_gap: float = 2.0) -> List[dict]:
+    """Run every point on a process pool; rows come back in grid order."""
+    workers = workers or os.cpu_count() or 1
+    jobs = [(p, calls, mean_gap) for p in points]
+    if workers == 1:
+        return [_run_point_star(job) for job in jobs]
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_point_star, jobs, chunksize=chunksize))
+
+
+def format_table(rows: List[dict]) -> str:
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in COLUMNS}
+    lines = ["  ".join(c.rjust(widths[c]) for c in COLUMNS)]
+    for row in rows:
+        lines.append("  ".join(str(row[c]).rjust(widths[c]) for c in COLUMNS))
+    return "\n".join(lines)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Sweep strategies and building configurations.")
+    parser.add_argument("--floors", type=int, nargs="+", default=[6])
+    parser.add_argument("--elevators", type=int, nargs="+", default=[2])
+    parser.add_argument("--strategies", nargs="+", default=registry.strategy_names(),
+                        choices=registry.strategy_names())
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1])
+    parser.add_argument("--calls", type=int, default=500, help="calls per run")
+    parser.add_argument("--mean-gap", type=float, default=2.0, help="mean ticks between calls")
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--csv", help="also write the table to this CSV file")
+    args = parser.parse_args(argv)
+
+    points = [SweepPoint(*combo) for combo in itertools.product(
+        args.floors, args.elevators, args.strategies, args.seeds)]
+    rows = run_sweep(points, args.workers, args.calls, args.mean_gap)
+
+    print(format_table(rows))
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,406 @@
+"""
+Synthetic passenger traffic, generated lazily.
+
+Passengers are yielded one at a time from (optionally time-varying) Poisson
+arrival processes, so a full day of traffic never exists as a list. A
+TrafficFeeder turns them into FloorRequests when they arrive and into
+CabinRequests when they board a cab. Streams can be stored in a compact
+binary file and read back just as lazily.
+
+    python traffic.py generate out.trf --floors 20 --pattern up_peak --rate 0.5
+    python traffic.py run out.trf --floors 20 --elevators 4
+"""
+import argparse
+import itertools
+import random
+import struct
+import sys
+import time
+from array import array
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Union
+
+from building import Building
+from elevator import ElevatorState
+from requests import FloorRequest, CabinRequest
+from zoning import ZonePlan, is_zoned
+
+
+class Passenger(NamedTuple):
+    tick: int
+    origin: int
+    destination: int
+
+
+class Segment(NamedTuple):
+    """A span of the day with one traffic pattern: [start, end) at `rate` passengers/tick."""
+    start: int
+    end: int
+    pattern: str
+    rate: float
+
+
+Rate = Union[float, Callable[[float], float]]
+
+PATTERNS = ("up_peak", "down_peak", "lunch", "interfloor")
+
+
+# ----------------------------------------------------------------------
+# Arrival processes
+# ----------------------------------------------------------------------
+def poisson_arrivals(rng: random.Random, rate: Rate, start: float, end: float,
+                     peak_rate: Optional[float] = None) -> Iterator[float]:
+    """
+    Arrival times in [start, end) of a Poisson process.
+
+    `rate` may be a function of time; it is then sampled by thinning against
+    `peak_rate`, which must bound it from above.
+    """
+    varying = callable(rate)
+    bound = peak_rate if varying else rate
+    if not bound or bound <= 0:
+        return
+    t = start
+    while True:
+        t += rng.expovariate(bound)
+        if t >= end:
+            return
+        if not varying or rng.random() * bound < rate(t):
+            yield t
+
+
+def _trip(rng: random.Random, pattern: str, floors: int, lobby: int):
+    """Pick (origin, destination) for one passenger of the given pattern."""
+    def other_than(floor: int) -> int:
+        pick = rng.randrange(floors - 1)
+        return pick + 1 if pick >= floor else pick
+
+    if pattern == "up_peak":
+        return lobby, other_than(lobby)
+    if pattern == "down_peak":
+        origin = other_than(lobby)
+        return origin, lobby
+    if pattern == "lunch":
+        # Half the trips leave for lunch, half come back.
+        floor = other_than(lobby)
+        return (floor, lobby) if rng.random() < 0.5 else (lobby, floor)
+    if pattern == "interfloor":
+        origin = rng.randrange(floors)
+        return origin, other_than(origin)
+    raise ValueError(f"unknown traffic pattern {pattern!r}; choose from {PATTERNS}")
+
+
+def generate_traffic(
+    total_floors: int,
+    duration: int,
+    rate: Rate,
+    pattern: str = "interfloor",
+    seed: int = 0,
+    lobby: int = 0,
+    start: int = 0,
+    peak_rate: Optional[float] = None,
+) -> Iterator[Passenger]:
+    """Lazily yield passengers of one pattern arriving in [start, start + duration)."""
+    _check_floors(total_floors, lobby)
+    return _generate(total_floors, duration, rate, pattern, seed, lobby, start, peak_rate)
+
+
+def _generate(total_floors, duration, rate, pattern, seed, lobby, start, peak_rate) -> Iterator[Passenger]:
+    rng = random.Random(seed)
+    for t in poisson_arrivals(rng, rate, start, start + duration, peak_rate):
+        origin, destination = _trip(rng, pattern, total_floors, lobby)
+        yield Passenger(int(t), origin, destination)
+
+
+def generate_day(total_floors: int, segments: Iterable[Segment], seed: int = 0,
+                 lobby: int = 0) -> Iterator[Passenger]:
+    """Chain several segments (assumed in time order) into one stream."""
+    _check_floors(total_floors, lobby)
+    return itertools.chain.from_iterable(
+        generate_traffic(total_floors, seg.end - seg.start, seg.rate, seg.pattern,
+                         seed=f"{seed}-{index}", lobby=lobby, start=seg.start)
+        for index, seg in enumerate(segments)
+    )
+
+
+def _check_floors(total_floors: int, lobby: int) -> None:
+    # Checked up front: generators would only fail once first iterated.
+    if total_floors < 2:
+        raise ValueError(f"traffic needs at least 2 floors, got {total_floors}")
+    if not 0 <= lobby < total_floors:
+        raise ValueError(f"lobby {lobby} is outside floors 0-{total_floors - 1}")
+
+
+def office_day(ticks_per_hour: int = 3600, rate: float = 0.1) -> List[Segment]:
+    """A typical office day from 07:00: morning up-peak, lunch, afternoon, evening down-peak."""
+    h = ticks_per_hour
+    return [
+        Segment(0 * h, 2 * h, "up_peak", rate),
+        Segment(2 * h, 5 * h, "interfloor", rate / 4),
+        Segment(5 * h, 7 * h, "lunch", rate / 2),
+        Segment(7 * h, 10 * h, "interfloor", rate / 4),
+        Segment(10 * h, 12 * h, "down_peak", rate),
+    ]
+
+
+# ----------------------------------------------------------------------
+# Compact file format: 8-byte header + 8 bytes per passenger
+# ----------------------------------------------------------------------
+_MAGIC = b"ELTR\x01\x00\x00\x00"
+_RECORD = struct.Struct("<IHH")       # tick, origin, destination
+_CHUNK = 4096                          # records per read/write
+
+
+def write_traffic(path: str, passengers: Iterable[Passenger]) -> int:
+    """Stream passengers into a binary traffic file; returns the number written."""
+    count = 0
+    pack = _RECORD.pack
+    with open(path, "wb") as fh:
+        fh.write(_MAGIC)
+        buffer = []
+        for p in passengers:
+            buffer.append(pack(p.tick, p.origin, p.destination))
+            if len(buffer) == _CHUNK:
+                fh.write(b"".join(buffer))
+                count += len(buffer)
+                buffer.clear()
+        fh.write(b"".join(buffer))
+        count += len(buffer)
+    return count
+
+
+def read_traffic(path: str) -> Iterator[Passenger]:
+    """Lazily read passengers back from a binary traffic file."""
+    with open(path, "rb") as fh:
+        if fh.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path}: not a traffic file")
+        while True:
+            chunk = fh.read(_RECORD.size * _CHUNK)
+            if not chunk:
+                return
+            for fields in _RECORD.iter_unpack(chunk):
+                yield Passenger(*fields)
+
+
+# ----------------------------------------------------------------------
+# Feeding a Building
+# ----------------------------------------------------------------------
+class PassengerPool:
+    """
+    Struct-of-arrays store for passengers in the building.
+
+    A passenger is a slot index into an int32 array of destinations;
+    delivered passengers give their slot back to a free list, so a long run
+    keeps reusing a few thousand slots (4 bytes each) instead of allocating a
+    record per trip.
+    Per-car load is tracked against an optional capacity.
+    """
+
+    def __init__(self, capacity: Optional[int] = None):
+        self.capacity = capacity
+        self.destination = array("i")
+        self.load: Dict[int, int] = defaultdict(int)     # car identifier -> riders
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        """Passengers currently waiting or riding."""
+        return len(self.destination) - len(self._free)
+
+    def acquire(self, destination: int) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self.destination[slot] = destination
+            return slot
+        self.destination.append(destination)
+        return len(self.destination) - 1
+
+    def release(self, slot: int) -> None:
+        self._free.append(slot)
+
+    def room(self, car: int) -> Optional[int]:
+        """Free places in car `car`, or None when cars are unlimited."""
+        return None if self.capacity is None else self.capacity - self.load[car]
+
+
+class TrafficFeeder:
+    """
+    Drives a Building from a passenger stream.
+
+    Call pump() before every Building.step: passengers whose arrival tick has
+    come press the hall button (add_floor_request); passengers waiting where a
+    cab has its doors open board it – up to `capacity` riders per car – and
+    press their destination (add_cabin_request); riders leave at their
+    destination.
+
+    In a zoned building (see zoning.py) hall calls carry the destination,
+    passengers only board cars on their route and change cars at sky lobbies.
+    Anyone left behind by an open cab calls again once its doors have closed.
+    """
+
+    def __init__(self, building: Building, passengers: Iterable[Passenger],
+                 capacity: Optional[int] = None):
+        self.building = building
+        self._stream = iter(passengers)
+        self._next: Optional[Passenger] = next(self._stream, None)
+        self._plan = ZonePlan(building.elevators) if is_zoned(building.elevators) else None
+        self.pool = PassengerPool(capacity)
+        self._waiting: Dict[int, List[int]] = defaultdict(list)   # floor -> passenger slots
+        # car -> floor where riders get off -> passenger slots
+        self._riding: Dict[int, Dict[int, List[int]]] = defaultdict(lambda: defaultdict(list))
+        self._recall: Set[int] = set()       # floors with passengers left behind by an open cab
+        self.arrived = 0
+        self.boarded = 0
+        self.delivered = 0
+        self.transfers = 0
+
+    def exhausted(self) -> bool:
+        """True once every passenger has arrived and been delivered."""
+        return self._next is None and self.delivered == self.arrived
+
+    def extend(self, passengers: Iterable[Passenger]) -> None:
+        """Feed more passengers, in tick order and no earlier than those already given."""
+        if self._next is None:
+            self._stream = iter(passengers)
+            self._next = next(self._stream, None)
+        else:
+            self._stream = itertools.chain(self._stream, passengers)
+
+    def pump(self) -> None:
+        building = self.building
+        open_cabs = [e for e in building.elevators if e.state == ElevatorState.DOORS_OPEN]
+        open_floors = {e.current_floor for e in open_cabs}
+
+        clock, floors = building.clock, building.total_floors
+        while self._next is not None and self._next.tick <= clock:
+            p = self._next
+            if not (0 <= p.origin < floors and 0 <= p.destination < floors):
+                raise ValueError(f"passenger {p} does not fit a {floors}-floor building")
+            # Nobody presses the hall button in front of an open cab.
+            if p.origin not in open_floors:
+                self._call(p.origin, p.destination)
+            self._waiting[p.origin].append(self.pool.acquire(p.destination))
+            self.arrived += 1
+            self._next = next(self._stream, None)
+
+        destination = self.pool.destination
+        for floor in [f for f in self._recall if f not in open_floors]:
+            self._recall.discard(floor)
+            pressed = set()
+            for slot in self._waiting.get(floor, ()):
+                button = destination[slot] if self._plan else destination[slot] > floor
+                if button not in pressed:
+                    pressed.add(button)
+                    self._call(floor, destination[slot])
+
+        for elevator in open_cabs:
+            self._exchange(elevator)
+
+    def _call(self, floor: int, destination: int) -> None:
+        self.building.add_floor_request(FloorRequest(
+            floor, destination > floor, destination=destination if self._plan else None))
+
+    def _exchange(self, elevator) -> None:
+        floor, car, pool = elevator.current_floor, elevator.identifier, self.pool
+        riders = self._riding[car]
+        leaving = riders.pop(floor, ())
+        pool.load[car] -= len(leaving)
+        for slot in leaving:
+            if pool.destination[slot] == floor:
+                self.delivered += 1
+                pool.release(slot)
+            else:                                    # changing cars at a sky lobby
+                self.transfers += 1
+                self._waiting[floor].append(slot)
+        waiting = self._waiting.pop(floor, None)
+        if not waiting:
+            return
+        room = pool.room(car)
+        left = []
+        for slot in waiting:
+            exit_floor = pool.destination[slot]
+            if self._plan is not None and room != 0:
+                exit_floor = (self._plan.hop(elevator, floor, exit_floor)
+                              if self._plan.can_take(elevator, floor, exit_floor) else None)
+            if room == 0 or exit_floor is None:
+                left.append(slot)
+                continue
+            if room is not None:
+                room -= 1
+            riders[exit_floor].append(slot)
+            self.building.add_cabin_request(CabinRequest(car, exit_floor))
+            self.boarded += 1
+        pool.load[car] += len(waiting) - len(left)
+        if left:
+            self._waiting[floor] = left
+            self._recall.add(floor)
+
+
+def run_traffic(building: Building, passengers: Iterable[Passenger],
+                max_ticks: Optional[int] = None, capacity: Optional[int] = None) -> dict:
+    """Step the building until every passenger has been delivered (or `max_ticks`)."""
+    feeder = TrafficFeeder(building, passengers, capacity)
+    started = time.perf_counter()
+    while not (feeder.exhausted() and building.is_idle()):
+        if max_ticks is not None and building.clock >= max_ticks:
+            break
+        feeder.pump()
+        building.step()
+    elapsed = time.perf_counter() - started
+    return {
+        "ticks": building.clock,
+        "passengers": feeder.arrived,
+        "delivered": feeder.delivered,
+        "elapsed_s": elapsed,
+        "ticks_per_s": building.clock / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def main(argv=None) -> None:
+    from main import create_building
+    from scenario import format_summary
+
+    parser = argparse.ArgumentParser(description="Generate or replay synthetic traffic.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="write a traffic file")
+    gen.add_argument("path")
+    gen.add_argument("--floors", type=int, default=6, help="at least 2")
+    gen.add_argument("--pattern", choices=PATTERNS + ("day",), default="interfloor")
+    gen.add_argument("--rate", type=float, default=0.1, help="passengers per tick")
+    gen.add_argument("--duration", type=int, default=3600, help="ticks")
+    gen.add_argument("--seed", type=int, default=0)
+
+    run = sub.add_parser("run", help="simulate a traffic file headless")
+    run.add_argument("path")
+    run.add_argument("--floors", type=int, default=6)
+    run.add_argument("--elevators", type=int, default=2)
+    run.add_argument("--zones", type=int, default=0,
+                     help="sky-lobby zones; --elevators is then the number of cars per zone")
+    run.add_argument("--shuttles", type=int, default=2, help="express cars serving the sky lobbies")
+    run.add_argument("--capacity", type=int, default=None, help="passengers per car (default unlimited)")
+    run.add_argument("--max-ticks", type=int, default=None, help="stop after this many ticks")
+
+    args = parser.parse_args(argv)
+    if args.floors < 2:
+        parser.error("--floors must be at least 2")
+    if args.command == "generate":
+        if args.pattern == "day":
+            stream = generate_day(args.floors, office_day(args.duration // 12, args.rate), args.seed)
+        else:
+            stream = generate_traffic(args.floors, args.duration, args.rate, args.pattern, args.seed)
+        print(f"wrote {write_traffic(args.path, stream)} passengers to {args.path}")
+    else:
+        if args.zones:
+            from zoning import create_sky_lobby_building
+            building = create_sky_lobby_building(args.floors, args.zones, args.elevators, args.shuttles)
+        else:
+            building = create_building(args.floors, args.elevators)
+        try:
+            summary = run_traffic(building, read_traffic(args.path), args.max_ticks, args.capacity)
+        except ValueError as exc:
+            sys.exit(f"error: {exc} – pass --floors to match the traffic file")
+        print(format_summary(summary))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
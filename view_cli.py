@@ -1,23 +1,57 @@
+from typing import Dict, Optional, TextIO
+
 from elevator import ElevatorState
 from building import Building
 
+MODES = ("full", "diff", "summary")
+
+
 class ViewCLI:
-    """Console view that prints the state after every simulation tick."""
+    """
+    Console view that prints the state after every simulation tick.
 
-    def __init__(self, building: Building) -> None:
-        self._tick = 0
+    Modes:
+      • full    – every elevator and the pending hallway calls (default)
+      • diff    – only elevators whose floor, state or queue changed; a
+                  repeat render at the same tick (e.g. 'status') shows all
+      • summary – one line per tick
+    Output goes to `out` (default sys.stdout), so scripted runs can hand in
+    a block-buffered writer instead of paying for a tty write per line.
+    """
+
+    def __init__(self, building: Building, mode: str = "full",
+                 out: Optional[TextIO] = None) -> None:
+        if mode not in MODES:
+            raise ValueError(f"unknown view mode {mode!r}; choose from {MODES}")
+        self._mode = mode
+        self._out = out
+        self._last: Dict[int, tuple] = {}
+        self._last_clock: Optional[int] = None
         building.add_observer(self.render)
 
+    def _write(self, text: str) -> None:
+        print(text, file=self._out)
+
     # ------------------------------------------------------------------
     # Observer callback
     # ------------------------------------------------------------------
     def render(self, building: Building) -> None:
-        self._tick += 1
-        print(f"\n--- tick {self._tick} ---")
+        if self._mode == "summary":
+            self._render_summary(building)
+            return
 
+        # No tick since the last render: an explicit status request, show everything.
+        diff = self._mode == "diff" and building.clock != self._last_clock
+        self._last_clock = building.clock
+        lines = [f"\n--- tick {building.clock} ---"]
         for elevator in building.elevators:
             queue = list(elevator.target_floors)
-            print(
+            if self._mode == "diff":
+                seen = (elevator.current_floor, elevator.state, tuple(queue))
+                if diff and self._last.get(elevator.identifier) == seen:
+                    continue
+                self._last[elevator.identifier] = seen
+            lines.append(
                 f"E{elevator.identifier} | floor {elevator.current_floor} | "
                 f"{elevator.state.name} | queue {queue}"
             )
@@ -27,6 +61,17 @@ class ViewCLI:
                 f"{req.floor}{'↑' if req.direction_up else '↓'}"
                 for req in building.hallway_queue
             )
-            print("pending hallway calls:", hall_calls)
+            lines.append(f"pending hallway calls: {hall_calls}")
+
+        if diff and len(lines) == 1:
+            return                                   # nothing changed this tick
+        lines.append("----------------")
+        self._write("\n".join(lines))
 
-        print("----------------")
+    def _render_summary(self, building: Building) -> None:
+        busy = sum(1 for e in building.elevators if e.state != ElevatorState.IDLE)
+        stops = sum(len(e.target_floors) for e in building.elevators)
+        self._write(
+            f"tick {building.clock} | busy {busy}/{len(building.elevators)} | "
+            f"stops {stops} | hall calls {len(building.hallway_queue)}"
+        )
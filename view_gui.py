@@ -1,11 +1,12 @@
 # view_gui.py – big labels, sidebar cabin panel, auto-tick
+import time
 import tkinter as tk
 from tkinter import ttk
 
 from building import Building
 from elevator import Elevator, ElevatorState
 from requests import FloorRequest, CabinRequest
-from strategy import NearestElevatorStrategy, LeastBusyElevatorStrategy
+import registry
 
 # ───────── drawing constants ─────────────────────────────────────────────
 SHAFT_W = 90
@@ -13,11 +14,18 @@ MARGIN  = 6
 CAB_H   = 24
 CAB_W   = SHAFT_W - 2 * MARGIN
 GAP     = 18
-TICK_MS = 1000  # >0 → auto-tick every n ms
-
-STRATEGIES = {
-    "Nearest":    NearestElevatorStrategy,
-    "Least busy": LeastBusyElevatorStrategy,
+TICK_MS = 1000  # >0 → auto-tick every n ms (at 1x speed)
+FRAME_MS = 50   # canvas refresh period, independent of the simulation rate
+
+HISTORY_TICKS = 20_000       # rows kept for the space-time view
+SPAN_CHOICES = (100, 1000, 10_000)
+CAR_COLOURS = ("#e53935", "#1e88e5", "#43a047", "#fb8c00", "#8e24aa", "#00897b", "#6d4c41", "#3949ab")
+
+SPEEDS = {          # simulated ticks per TICK_MS of wall time; None = as fast as possible
+    "1x":   1,
+    "10x":  10,
+    "100x": 100,
+    "max":  None,
 }
 
 
@@ -35,15 +43,20 @@ class ViewGUI(ttk.Frame):
         self._floors  = building.total_floors         
         self._cab_tags: dict[str, Elevator] = {}
         self._selected: Elevator | None = None
-        building.add_observer(self._redraw)
+        self._dirty = True          # model changed since the last rendered frame
+        self._tick_debt = 0.0       # fractional ticks carried between frames
+        building.add_observer(self._on_model_change)
+        if building.history is None:
+            try:
+                building.enable_history(HISTORY_TICKS)  # so the space-time view can look back
+            except ImportError:
+                pass                                    # no NumPy: no space-time view
 
         self._create_left_panel()
         self._create_canvas()
         self._create_right_panel()
 
-        self._redraw(building)
-        if TICK_MS:
-            self._auto_tick()
+        self._frame()
 
     # ───────────────────────── left panel ───────────────────────────────
     def _create_left_panel(self):
@@ -79,6 +92,8 @@ class ViewGUI(ttk.Frame):
         self.canvas = tk.Canvas(self, width=width, height=height, bg="white")
         self.canvas.grid(row=0, column=1, sticky="nsew")
         self.canvas.bind("<Button-1>", self._on_canvas_click)
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
+        self._build_scene()
 
     # ───────────────────────── right panel  ──────────────────
     def _create_right_panel(self):
@@ -86,15 +101,24 @@ class ViewGUI(ttk.Frame):
         right.grid(row=0, column=2, sticky="ns")
 
         ttk.Label(right, text="Strategy", font=("Segoe UI", 11, "bold")).pack()
-        self._strategy_var = tk.StringVar(value="Nearest")
-        for name in STRATEGIES:
+        self._strategy_var = tk.StringVar(value=registry.strategy_name(self.building.dispatch_strategy))
+        for name in registry.strategy_names():
             ttk.Radiobutton(
-                right, text=name, value=name, variable=self._strategy_var,
+                right, text=registry.strategy_label(name), value=name, variable=self._strategy_var,
                 command=self._on_strategy_change,
             ).pack(anchor="w")
 
+        ttk.Separator(right, orient="horizontal").pack(fill="x", pady=8)
+        ttk.Label(right, text="Speed", font=("Segoe UI", 11, "bold")).pack()
+        self._speed_var = tk.StringVar(value="1x")
+        for name in SPEEDS:
+            ttk.Radiobutton(right, text=name, value=name, variable=self._speed_var).pack(anchor="w")
+
         ttk.Separator(right, orient="horizontal").pack(fill="x", pady=8)
         ttk.Button(right, text="Tick", command=self._tick).pack(fill="x")
+        ttk.Button(right, text="Space-time", command=self._open_space_time,
+                   state="normal" if self.building.history is not None else "disabled",
+                   ).pack(fill="x", pady=(6, 0))
         ttk.Button(right, text="Quit", command=self.quit).pack(fill="x", pady=6)
 
         ttk.Separator(right, orient="horizontal").pack(fill="x", pady=8)
@@ -103,7 +127,10 @@ class ViewGUI(ttk.Frame):
 
     # ───────────────────────── event helpers ────────────────────────────
     def _on_strategy_change(self):
-        self.building.set_dispatch_strategy(STRATEGIES[self._strategy_var.get()]())
+        self.building.set_dispatch_strategy(registry.create_strategy(self._strategy_var.get()))
+
+    def _open_space_time(self):
+        SpaceTimeWindow(self, self.building)
 
     def _hall_call(self, floor: int, up: bool):
         self.building.add_floor_request(FloorRequest(floor, up))
@@ -111,9 +138,36 @@ class ViewGUI(ttk.Frame):
     def _tick(self):
         self.building.step()
 
-    def _auto_tick(self):
-        self._tick()
-        self.after(TICK_MS, self._auto_tick)
+    def _on_model_change(self, _: Building):
+        self._dirty = True          # rendering happens on the next frame
+
+    def _frame(self):
+        """Fixed-rate loop: advance the model for this frame, then draw the latest state."""
+        started = time.perf_counter()
+        if TICK_MS:
+            self._advance_model(started)
+        if self._dirty:
+            self._dirty = False
+            self._redraw(self.building)
+        spent_ms = int((time.perf_counter() - started) * 1000)
+        self.after(max(1, FRAME_MS - spent_ms), self._frame)
+
+    def _advance_model(self, started: float):
+        speed = SPEEDS[self._speed_var.get()]
+        if speed is None:
+            # As many ticks as fit in most of the frame budget, one notification.
+            deadline = started + FRAME_MS * 0.8 / 1000
+            ticks = 0
+            while time.perf_counter() < deadline:
+                self.building.step(notify=False)
+                ticks += 1
+            if ticks:
+                self.building._notify_observers()
+            return
+        self._tick_debt += speed * FRAME_MS / TICK_MS
+        ticks = int(self._tick_debt)
+        self._tick_debt -= ticks
+        self.building.advance(ticks)
 
     def _on_canvas_click(self, event):
         item = self.canvas.find_closest(event.x, event.y)
@@ -156,43 +210,72 @@ class ViewGUI(ttk.Frame):
             child.destroy()
 
     # ───────────────────────── drawing ──────────────────────────────────
-    def _redraw(self, _: Building):
+    # Canvas items are created once; every tick only cabs whose floor, state
+    # or queue changed since the last render get their items updated.
+    def _build_scene(self):
         self.canvas.delete("all")
         self._cab_tags.clear()
-        self._draw_floor_lines()
+        self._cab_items: dict[int, dict[str, int]] = {}
+        self._rendered: dict[int, tuple] = {}
+
+        label_font = ("Segoe UI", 12, "bold")
+        self._floor_lines = []
+        for fl in range(self._floors):                       # 0 … top-1
+            y = self._floor_to_y(fl)
+            self._floor_lines.append(
+                self.canvas.create_line(40, y, self.canvas.winfo_width(), y, fill="#e0e0e0"))
+            self.canvas.create_text(20, y - 8, text=str(fl), font=label_font, anchor="e")
 
         for idx, elev in enumerate(self.building.elevators):
             x0 = 40 + idx * SHAFT_W + MARGIN
             x1 = x0 + SHAFT_W - 2 * MARGIN
-            y  = self._floor_to_y(elev.current_floor) - CAB_H
-
             self.canvas.create_rectangle(x0, 20, x1, self._canvas_h() - 20, outline="#888")
 
             tag = f"cab{elev.identifier}"
-            colour = "#4caf50" if elev.state != ElevatorState.IDLE else "#2196f3"
-            self.canvas.create_rectangle(x0 + 1, y, x0 + CAB_W, y + CAB_H,
-                                         fill=colour, outline="", tags=tag)
-            self.canvas.create_text(x0 + CAB_W / 2, y + CAB_H / 2,
-                                    text=f"E{elev.identifier}", fill="white", tags=tag)
+            self._cab_items[elev.identifier] = {
+                "x0": x0,
+                "x1": x1,
+                "body": self.canvas.create_rectangle(0, 0, 0, 0, outline="", tags=tag),
+                "label": self.canvas.create_text(0, 0, text=f"E{elev.identifier}",
+                                                 fill="white", tags=tag),
+                "arrow": self.canvas.create_text(0, 0, font=("Segoe UI", 12)),
+                "queue": self.canvas.create_text(0, 0, font=("Segoe UI", 8)),
+            }
             self._cab_tags[tag] = elev
+        self._scene_elevators = list(self.building.elevators)
 
-            arrow = {"MOVING_UP": "↑", "MOVING_DOWN": "↓"}.get(elev.state.name, "")
-            self.canvas.create_text(x1 + 10, y + CAB_H / 2, text=arrow, font=("Segoe UI", 12))
+    def _on_canvas_resize(self, event):
+        for line in self._floor_lines:
+            x0, y, _, _ = self.canvas.coords(line)
+            self.canvas.coords(line, x0, y, event.width, y)
 
-            queue = list(elev.target_floors)
-            if queue:
-                self.canvas.create_text(
-                    x0 + CAB_W / 2, y - 14,
-                    text="→ " + ",".join(map(str, queue)),
-                    font=("Segoe UI", 8)
-                )
+    def _redraw(self, _: Building):
+        if self._scene_elevators != self.building.elevators:
+            self._build_scene()
 
-    def _draw_floor_lines(self):
-        label_font = ("Segoe UI", 12, "bold")
-        for fl in range(self._floors):                       # 0 … top-1
-            y = self._floor_to_y(fl)
-            self.canvas.create_line(40, y, self.canvas.winfo_width(), y, fill="#e0e0e0")
-            self.canvas.create_text(20, y - 8, text=str(fl), font=label_font, anchor="e")
+        for elev in self.building.elevators:
+            queue = tuple(elev.target_floors)
+            seen = (elev.current_floor, elev.state, queue)
+            if self._rendered.get(elev.identifier) == seen:
+                continue                                     # nothing changed
+            self._rendered[elev.identifier] = seen
+
+            items = self._cab_items[elev.identifier]
+            x0, x1 = items["x0"], items["x1"]
+            y = self._floor_to_y(elev.current_floor) - CAB_H
+
+            colour = "#4caf50" if elev.state != ElevatorState.IDLE else "#2196f3"
+            self.canvas.coords(items["body"], x0 + 1, y, x0 + CAB_W, y + CAB_H)
+            self.canvas.itemconfigure(items["body"], fill=colour)
+            self.canvas.coords(items["label"], x0 + CAB_W / 2, y + CAB_H / 2)
+
+            arrow = {"MOVING_UP": "↑", "MOVING_DOWN": "↓"}.get(elev.state.name, "")
+            self.canvas.coords(items["arrow"], x1 + 10, y + CAB_H / 2)
+            self.canvas.itemconfigure(items["arrow"], text=arrow)
+
+            self.canvas.coords(items["queue"], x0 + CAB_W / 2, y - 14)
+            self.canvas.itemconfigure(
+                items["queue"], text="→ " + ",".join(map(str, queue)) if queue else "")
 
     # ───────────────────────── helpers ──────────────────────────────────
     def _floor_to_y(self, floor: int) -> int:
@@ -200,3 +283,83 @@ class ViewGUI(ttk.Frame):
 
     def _canvas_h(self) -> int:
         return self._floors * GAP + 60
+
+
+class SpaceTimeWindow(tk.Toplevel):
+    """Floor-vs-time plot of the recent ticks, drawn from Building.history (nothing is re-simulated)."""
+
+    PAD_L, PAD_R, PAD_T, PAD_B = 36, 30, 10, 22
+
+    def __init__(self, master, building: Building) -> None:
+        super().__init__(master)
+        self.title("Space-time")
+        self.building = building
+        self._span = tk.IntVar(value=SPAN_CHOICES[1])
+        self._drawn = None          # (last tick, span, size) of the current picture
+        self._after_id = None
+
+        bar = ttk.Frame(self, padding=3)
+        bar.pack(fill="x")
+        ttk.Label(bar, text="Last").pack(side="left")
+        for span in SPAN_CHOICES:
+            ttk.Radiobutton(bar, text=f"{span} ticks", value=span, variable=self._span).pack(side="left")
+        self.canvas = tk.Canvas(self, width=720, height=max(240, building.total_floors * 12), bg="white")
+        self.canvas.pack(fill="both", expand=True)
+        self._refresh()
+
+    def destroy(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        super().destroy()
+
+    def _refresh(self):
+        history = self.building.history
+        if history is not None:
+            key = (history.last_tick(), self._span.get(),
+                   self.canvas.winfo_width(), self.canvas.winfo_height())
+            if key != self._drawn:
+                self._drawn = key
+                self._draw(history)
+        self._after_id = self.after(FRAME_MS * 4, self._refresh)
+
+    def _draw(self, history):
+        c = self.canvas
+        c.delete("all")
+        width, height = max(c.winfo_width(), 100), max(c.winfo_height(), 100)
+        x0, x1 = self.PAD_L, width - self.PAD_R
+        y0, y1 = self.PAD_T, height - self.PAD_B
+        span, last = self._span.get(), history.last_tick()
+        first = last - span
+        top = max(self.building.total_floors - 1, 1)
+
+        def x_of(ticks):
+            return x0 + (ticks - first) * (x1 - x0) / span
+
+        def y_of(floors):
+            return y1 - floors * (y1 - y0) / top
+
+        # axes: a grid line per labelled floor, first and last tick below
+        every = max(1, top // 10)
+        for floor in range(0, top + 1, every):
+            y = y_of(floor)
+            c.create_line(x0, y, x1, y, fill="#eeeeee")
+            c.create_text(x0 - 4, y, text=str(floor), anchor="e", font=("Segoe UI", 8))
+        c.create_text(x0, y1 + 4, text=str(max(first, 0)), anchor="nw", font=("Segoe UI", 8))
+        c.create_text(x1, y1 + 4, text=str(last), anchor="ne", font=("Segoe UI", 8))
+
+        past = history.window(first, None)
+        if len(past) < 2:
+            return
+        stride = max(1, len(past) // (x1 - x0))        # about one row per pixel
+        xs = x_of(past.ticks[::stride].astype(float))
+        ys = y_of(past.floors[::stride].astype(float))
+        doors = past.states[::stride] == ElevatorState.DOORS_OPEN.value
+        for col, ident in enumerate(past.identifiers):
+            colour = CAR_COLOURS[col % len(CAR_COLOURS)]
+            points = [v for pair in zip(xs.tolist(), ys[:, col].tolist()) for v in pair]
+            c.create_line(*points, fill=colour, width=1.5)
+            if stride == 1:                               # stops are only legible unsampled
+                for x, y in zip(xs[doors[:, col]].tolist(), ys[doors[:, col], col].tolist()):
+                    c.create_oval(x - 2, y - 2, x + 2, y + 2, outline=colour, fill=colour)
+            c.create_text(x1 + 4, ys[-1, col], text=f"E{ident}", fill=colour, anchor="w",
+                          font=("Segoe UI", 8))
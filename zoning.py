@@ -0,0 +1,200 @@
+"""
+Zoned group control for tall buildings.
+
+Cars are grouped into banks by their served-floor sets (Elevator.served_floors).
+A ZonePlan precomputes, per floor and direction, which cars can answer a hall
+call there, and – for calls that carry a destination – which banks get the
+passenger closest to it, counting transfers at sky lobbies (floors shared by
+two banks). ZonedDispatchStrategy wraps any other strategy and hands it only
+the eligible cars, so assignment cost grows with the bank, not the fleet.
+
+    building = create_sky_lobby_building(200, zones=4, cars_per_zone=12, shuttle_cars=16)
+"""
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from building import Building
+from elevator import Elevator, ServiceOrder
+from requests import FloorRequest
+from strategy import DispatchStrategy, NearestElevatorStrategy
+
+_UNREACHABLE = 1 << 30
+
+
+class ZonePlan:
+    """Floor → eligible-car tables and transfer routing for one fleet."""
+
+    def __init__(self, elevators: List[Elevator]):
+        top = max(e.total_floors for e in elevators)
+        everything = frozenset(range(top + 1))
+        self.banks: Dict[FrozenSet[int], List[Elevator]] = {}
+        for elevator in elevators:
+            served = elevator.served_floors if elevator.served_floors is not None else everything
+            self.banks.setdefault(served, []).append(elevator)
+        self._bank_of = {e: served for served, cars in self.banks.items() for e in cars}
+
+        # Hall-call eligibility: a car must serve the floor and somewhere beyond
+        # it in the requested direction; where no bank goes further that way
+        # (e.g. the top floor of a low zone), any car serving the floor will do
+        # – it can still take the passenger on via a transfer. Cars of
+        # identical banks share one list.
+        self._up: List[List[Elevator]] = []
+        self._down: List[List[Elevator]] = []
+        groups: Dict[Tuple[FrozenSet[int], ...], List[Elevator]] = {}
+        for floor in range(top + 1):
+            for table, beyond in ((self._up, max), (self._down, min)):
+                here = [served for served in self.banks if floor in served]
+                key = tuple(sorted(
+                    [served for served in here if beyond(served) != floor] or here, key=min))
+                if key not in groups:
+                    groups[key] = [e for served in key for e in self.banks[served]]
+                table.append(groups[key])
+
+        # Banks sharing a floor are connected by a transfer there.
+        self._links: Dict[FrozenSet[int], List[FrozenSet[int]]] = {
+            a: [b for b in self.banks if b is not a and a & b] for a in self.banks
+        }
+        self._distances: Dict[int, Dict[FrozenSet[int], int]] = {}
+        self._routed: Dict[Tuple[int, int], List[Elevator]] = {}
+
+    # ------------------------------------------------------------------
+    # Eligibility
+    # ------------------------------------------------------------------
+    def eligible(self, floor: int, direction_up: bool) -> List[Elevator]:
+        """Cars that can answer a hall call at `floor` going the given way (empty if none serves it)."""
+        table = self._up if direction_up else self._down
+        return table[floor] if 0 <= floor < len(table) else []
+
+    def eligible_for(self, floor: int, destination: int) -> List[Elevator]:
+        """Cars at `floor` on a shortest (fewest transfers) route to `destination`."""
+        key = (floor, destination)
+        cars = self._routed.get(key)
+        if cars is None:
+            distance = self._transfers_to(destination)
+            here = [served for served in self.banks if floor in served]
+            best = min((distance[served] for served in here), default=_UNREACHABLE)
+            cars = [] if best == _UNREACHABLE else [
+                e for served in here if distance[served] == best for e in self.banks[served]
+            ]
+            self._routed[key] = cars
+        return cars
+
+    def can_take(self, elevator: Elevator, floor: int, destination: int) -> bool:
+        """True if `elevator` is on a shortest route from `floor` to `destination`."""
+        served = self._bank_of[elevator]
+        if floor not in served:
+            return False
+        distance = self._transfers_to(destination)
+        best = min(distance[b] for b in self.banks if floor in b)
+        return distance[served] == best != _UNREACHABLE
+
+    def hop(self, elevator: Elevator, floor: int, destination: int) -> Optional[int]:
+        """Where a passenger bound for `destination` should leave this car: the destination or a sky lobby."""
+        served = self._bank_of[elevator]
+        if destination in served:
+            return destination
+        distance = self._transfers_to(destination)
+        if distance[served] == _UNREACHABLE:
+            return None
+        lobbies = [f for nxt in self._links[served] if distance[nxt] == distance[served] - 1
+                   for f in nxt & served if f != floor]
+        return min(lobbies, key=lambda f: abs(f - destination), default=None)
+
+    def _transfers_to(self, destination: int) -> Dict[FrozenSet[int], int]:
+        """Per bank, how many transfers it takes to reach `destination` (BFS over the bank graph)."""
+        distance = self._distances.get(destination)
+        if distance is None:
+            distance = dict.fromkeys(self.banks, _UNREACHABLE)
+            frontier = deque(served for served in self.banks if destination in served)
+            for served in frontier:
+                distance[served] = 0
+            while frontier:
+                bank = frontier.popleft()
+                for nxt in self._links[bank]:
+                    if distance[nxt] == _UNREACHABLE:
+                        distance[nxt] = distance[bank] + 1
+                        frontier.append(nxt)
+            self._distances[destination] = distance
+        return distance
+
+
+class ZonedDispatchStrategy(DispatchStrategy):
+    """
+    Restricts another strategy to the cars eligible for each call.
+
+    Calls with a known destination go to the banks that reach it with the
+    fewest transfers; other calls to any car serving the floor, preferring
+    those that continue in the requested direction. A call no car can take
+    gets None in the result; Building warns about it and counts it.
+    """
+
+    def __init__(self, inner: Optional[DispatchStrategy] = None):
+        self.inner = inner or NearestElevatorStrategy()
+        self._fleet: List[Elevator] = []
+        self.plan: Optional[ZonePlan] = None
+
+    def select_elevator(self, elevators: List[Elevator], request: FloorRequest) -> Optional[Elevator]:
+        if elevators is not self._fleet:
+            self._fleet = elevators
+            self.plan = ZonePlan(elevators)
+        if request.destination is not None:
+            candidates = self.plan.eligible_for(request.floor, request.destination)
+        else:
+            candidates = self.plan.eligible(request.floor, request.direction_up)
+        if not candidates:
+            return None
+        return self.inner.select_elevator(candidates, request)
+
+    def select_elevators(self, elevators: List[Elevator], requests: Iterable[FloorRequest]) -> List[Optional[Elevator]]:
+        chosen = []
+        for request in requests:
+            elevator = self.select_elevator(elevators, request)
+            if elevator is not None:
+                elevator.add_target_floor(request.floor, request.direction_up)
+            chosen.append(elevator)
+        return chosen
+
+
+def is_zoned(elevators: Iterable[Elevator]) -> bool:
+    return any(e.served_floors is not None for e in elevators)
+
+
+# ----------------------------------------------------------------------
+# Sky-lobby layout
+# ----------------------------------------------------------------------
+def sky_lobby_zones(total_floors: int, zones: int, cars_per_zone: int,
+                    shuttle_cars: int) -> List[FrozenSet[int]]:
+    """
+    Served-floor sets for a classic sky-lobby building.
+
+    Floors are split into `zones` stacked zones; zone 0 starts at the ground
+    floor, every higher zone at its own sky lobby. Each zone has a local bank
+    of `cars_per_zone` cars serving only that zone, and express shuttles link
+    the ground floor with every sky lobby.
+    """
+    height = -(-total_floors // zones)
+    starts = list(range(0, total_floors, height))
+    served = []
+    for start in starts:
+        served += [frozenset(range(start, min(start + height, total_floors)))] * cars_per_zone
+    served += [frozenset(starts)] * shuttle_cars
+    return served
+
+
+def create_sky_lobby_building(
+    total_floors: int,
+    zones: int,
+    cars_per_zone: int,
+    shuttle_cars: int,
+    strategy: Optional[DispatchStrategy] = None,
+    service_order: ServiceOrder = ServiceOrder.LOOK,
+    array_engine: bool = False,
+) -> Building:
+    """Zoned building with local banks per zone plus express shuttles (see sky_lobby_zones)."""
+    elevators = [
+        Elevator(ident, min(served), total_floors - 1, service_order, served)
+        for ident, served in enumerate(
+            sky_lobby_zones(total_floors, zones, cars_per_zone, shuttle_cars), start=1)
+    ]
+    return Building(total_floors, elevators, strategy or NearestElevatorStrategy(),
+                    array_engine=array_engine)